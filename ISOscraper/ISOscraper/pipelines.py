@@ -40,6 +40,10 @@ class JSONExport:
         return item
 
 class MongoPipeline:
+    # Same collection as api.models.mongodb_model.CATALOGUE_VERSIONS: bumping the
+    # spider's version stamp invalidates the API's cached /standards/ results.
+    catalogue_versions = "catalogue_versions"
+
     def __init__(self, mongo_uri, mongo_db):
         self.client = pymongo.MongoClient(mongo_uri)
         self.db = self.client[mongo_db]
@@ -70,6 +74,9 @@ class MongoPipeline:
         item_dict = ItemAdapter(item).asdict()
         try:
             self.db[spider.name].insert_one(item_dict)
+            self.db[self.catalogue_versions].update_one(
+                {"_id": spider.name}, {"$inc": {"version": 1}}, upsert=True
+            )
             self.logger.info(f'Inserted {item_dict["url"]} successfully!')
             return item
         except Exception as e:
@@ -11,6 +11,7 @@ from .blueprints.certification import certification_bp
 from .blueprints.chat import chat_bp
 from .blueprints.standards import standards_bp
 from .blueprints.user import user_bp
+from .commands import register_commands
 from .config import Config
 from .errors import register_error_handlers
 from .extensions import db, migrate, mail, blp
@@ -30,6 +31,7 @@ def create_app():
     db.init_app(app)
     migrate.init_app(app, db)
     register_error_handlers(app)
+    register_commands(app)
     mail.init_app(app)
     blp.init_app(app)
     setup_jwt_callbacks(jwt)
@@ -1,8 +1,9 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, request
 from flask_jwt_extended import jwt_required
 
+from api.errors import BadRequestError, NotFoundError
 from api.extensions import db
-from api.models.models import User, Organization, CertificationBody
+from api.models.models import User, Organization, CertificationBody, EmailOutbox, OutboxStatusEnum
 from api.utils.utils import roles_required
 
 admin_bp = Blueprint('admin', __name__, url_prefix='/admin')
@@ -35,3 +36,51 @@ def get_users():
 
     except Exception as e:
         return jsonify({"msg": "Error fetching users", "error": str(e)}), 500
+
+
+def _outbox_entry_data(entry):
+    return {
+        "id": entry.id,
+        "subject": entry.subject,
+        "recipients": entry.recipients,
+        "status": entry.status.value,
+        "attempts": entry.attempts,
+        "last_error": entry.last_error,
+        "next_attempt_at": entry.next_attempt_at.isoformat() if entry.next_attempt_at else None,
+        "created_at": entry.created_at.isoformat() if entry.created_at else None,
+        "sent_at": entry.sent_at.isoformat() if entry.sent_at else None,
+    }
+
+
+@admin_bp.route('/outbox', methods=['GET'])
+@jwt_required()
+@roles_required("admin")
+def get_outbox_messages():
+    """List outbox messages, optionally filtered by ?status=pending|sent|failed."""
+    query = EmailOutbox.query
+    if status := request.args.get('status'):
+        try:
+            query = query.filter_by(status=OutboxStatusEnum(status))
+        except ValueError:
+            raise BadRequestError(f"Invalid status. Valid statuses are: "
+                                  f"{', '.join(s.value for s in OutboxStatusEnum)}")
+    try:
+        limit = int(request.args.get('limit', 100))
+    except ValueError:
+        limit = 0
+    if limit < 1:
+        raise BadRequestError("Invalid limit. It must be a positive integer.")
+    limit = min(limit, 500)
+    entries = query.order_by(EmailOutbox.created_at.desc()).limit(limit).all()
+    return jsonify([_outbox_entry_data(entry) for entry in entries]), 200
+
+
+@admin_bp.route('/outbox/<string:message_id>', methods=['GET'])
+@jwt_required()
+@roles_required("admin")
+def get_outbox_message(message_id):
+    """Delivery status of a single outbox message."""
+    entry = EmailOutbox.query.get(message_id)
+    if not entry:
+        raise NotFoundError("Outbox message not found.")
+    return jsonify(_outbox_entry_data(entry)), 200
@@ -115,8 +115,6 @@ class AuditRequestList(MethodView):
             status=RequestStatusEnum.PENDING
         )
         db.session.add(audit_request)
-        db.session.commit()
-
 
         cb_managers = User.query.filter_by(
             certification_body_id=req_data['certification_body_id'],
@@ -124,10 +122,11 @@ class AuditRequestList(MethodView):
         ).all()
         print(cb_managers)
 
+        send_audit_request_notification_to_cb_managers(audit_request, cb_managers)
+        db.session.commit()
+
         if not cb_managers:
             return {"message": "No managers found for the specified certification body."}, 404
-        print('WE HERE')
-        send_audit_request_notification_to_cb_managers(audit_request, cb_managers)
 
         return audit_request
 
@@ -184,8 +183,6 @@ class AuditRequestAction(MethodView):
         else:  # reject
             audit_request.status = RequestStatusEnum.REJECTED
 
-        db.session.commit()
-
         # Notify organization managers
         org_managers = User.query.filter_by(
             organization_id=audit_request.organization_id,
@@ -194,6 +191,8 @@ class AuditRequestAction(MethodView):
         approved = (action == 'approve')
         send_audit_request_response_to_org_managers(audit_request, org_managers, approved=approved)
 
+        db.session.commit()
+
         return new_audit
 
 
@@ -252,10 +251,11 @@ class CreateAuditForOrganization(MethodView):
             manager_id=current_user_id
         )
         db.session.add(new_audit)
-        db.session.commit()
 
         # Notify all members (managers + employees) of that organization
         org_users = User.query.filter_by(organization_id=audit_data['organization_id']).all()
         send_audit_created_notification(new_audit, org_users)
 
+        db.session.commit()
+
         return new_audit
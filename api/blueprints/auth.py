@@ -44,8 +44,8 @@ from api.utils.utils import (
     confirm_reset_token,
     verify_invitation_token
 )
-from ..extensions import db, mail
-from ..utils.email_utils import send_account_confirmation_email, send_password_reset_email
+from ..extensions import db
+from ..utils.email_utils import send_account_confirmation_email, send_password_reset_email, queue_email
 
 auth_bp = Blueprint("Auth", "auth", url_prefix="/auth", description="Authentication services")
 
@@ -128,18 +128,6 @@ class UserRegister(MethodView):
             invitation.is_used = True
             invitation.responded_at = datetime.utcnow()
 
-            try:
-                db.session.add(new_user)
-                db.session.commit()
-            except SQLAlchemyError as exc:
-                db.session.rollback()
-                raise InternalServerError(f"Database error during registration: {str(exc)}")
-
-            access_token = create_access_token(
-                identity=new_user.id,
-                additional_claims={"email": new_user.email, "role": new_user.role.value}
-            )
-
             organization = Organization.query.get(invitation.organization_id) if invitation.organization_id else None
             org_name = organization.name if organization else "Your Organization"
 
@@ -156,15 +144,19 @@ class UserRegister(MethodView):
                     f"{org_name}"
                 )
             )
+
             try:
-                mail.send(msg)
-            except Exception as exc:
-                return {
-                    "message": (
-                        "Registration successful, but sending the welcome email failed."
-                    ),
-                    "access_token": access_token
-                }
+                db.session.add(new_user)
+                queue_email(msg)
+                db.session.commit()
+            except SQLAlchemyError as exc:
+                db.session.rollback()
+                raise InternalServerError(f"Database error during registration: {str(exc)}")
+
+            access_token = create_access_token(
+                identity=new_user.id,
+                additional_claims={"email": new_user.email, "role": new_user.role.value}
+            )
 
             return {
                 "message": "Registration successful.",
@@ -179,26 +171,18 @@ class UserRegister(MethodView):
         )
         user.set_password(password)
 
+        token = generate_confirmation_token(user.email)
+        frontend_url = f"https://127.0.0.1:5000/auth/verify-email/"
+        confirmation_url = f"{frontend_url}?token={token}"
+
         try:
             db.session.add(user)
+            send_account_confirmation_email(user, confirmation_url)
             db.session.commit()
         except SQLAlchemyError as exc:
             db.session.rollback()
             raise InternalServerError(f"Database error during registration: {str(exc)}")
 
-        token = generate_confirmation_token(user.email)
-        frontend_url = f"https://127.0.0.1:5000/auth/verify-email/"
-        confirmation_url = f"{frontend_url}?token={token}"
-        try:
-            send_account_confirmation_email(user, confirmation_url)
-        except Exception as exc:
-            return {
-                "message": (
-                    "Guest registered successfully, but the confirmation email could "
-                    f"not be sent: {str(exc)}"
-                )
-            },400
-
         return {"message": "Guest registered successfully. Please confirm your email."}
 
 
@@ -321,7 +305,9 @@ class PasswordResetRequest(MethodView):
         reset_url = url_for("Auth.PasswordReset", token=token, _external=True)
         try:
             send_password_reset_email(user, reset_url)
-        except Exception as exc:
+            db.session.commit()
+        except SQLAlchemyError as exc:
+            db.session.rollback()
             return {
                 "message": (
                     f"Password reset email could not be sent {str(exc)}"
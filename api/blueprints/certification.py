@@ -1,16 +1,28 @@
+import io
+import os
+import uuid
 from datetime import datetime
+from urllib.parse import quote
 
 from flask.views import MethodView
 from flask_smorest import Blueprint
-from flask import send_file
+from flask import send_file, url_for, current_app, request, stream_with_context, jsonify, redirect
+from sqlalchemy.orm import joinedload
 from ..extensions import db
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from api.models.models import User, Audit, Certification, AuditStatusEnum, CertificationStatusEnum
-from api.schemas.certification_schemas import CertificationSchema, CertificationCreateSchema
+from api.models.models import User, Organization, Audit, Certification, AuditStatusEnum, CertificationStatusEnum, \
+    PdfStatusEnum, RoleEnum, generate_verification_code
+from api.schemas.certification_schemas import CertificationSchema, CertificationCreateSchema, \
+    CertificationPdfStatusSchema, CertificationBulkCreateSchema, CertificationBulkResultSchema, \
+    CertificateVerificationSchema, CertificationRevokeSchema, RevocationListQuerySchema
 from api.utils.utils import roles_required
-from api.utils.certification_utils import generate_certificate_pdf
-from api.utils.email_utils import send_certification_email
-from api.errors import BadRequestError, ForbiddenError, NotFoundError
+from api.utils.export_utils import stream_certificates_zip
+from api.utils.storage import get_storage, attachment_disposition
+from api.utils.verification_utils import verify_certificate, invalidate_verification
+from api.utils.revocation_utils import revoke_certification, revocation_list
+from api.utils.render_jobs import enqueue_certificate_render, render_certificates_in_pool, issue_on_demand, \
+    render_certificate_on_demand
+from api.errors import BadRequestError, ForbiddenError, NotFoundError, ConflictError
 
 certification_bp = Blueprint('Certification', 'certification', url_prefix='/certification')
 
@@ -65,20 +77,227 @@ class CertificationList(MethodView):
             issued_date=certification_data['issued_date'],
             status=CertificationStatusEnum.ISSUED,
             issuer_id=user_id,
-            certificate_pdf=generate_certificate_pdf(
-                {"organization_id": audit.organization_id, "recipient_name": audit.organization.name,
-                 "checklist": audit.checklist}),
+            pdf_status=PdfStatusEnum.PENDING,
         )
-        print('WE HERE')
-
         db.session.add(certification)
         db.session.commit()
 
-        send_certification_email(certification)
+        # The PDF is rendered (and the organization emailed) by a render job; poll the status endpoint.
+        download_url = url_for('Certification.DownloadCertification', certificate_id=certification.id, _external=True)
+        enqueue_certificate_render(certification, download_url)
+
+        return certification
+
+
+@certification_bp.route('/certificates/bulk')
+class CertificationBulkIssue(MethodView):
+    @certification_bp.arguments(CertificationBulkCreateSchema)
+    @certification_bp.response(200, CertificationBulkResultSchema)
+    @jwt_required()
+    @roles_required(['admin', 'manager'])
+    def post(self, bulk_data):
+        """Issue certifications for many completed audits at once.
+
+        The audits are validated up front and the PDFs are rendered in parallel
+        on the process pool. All certifications are inserted in a single transaction.
+        Each audit gets its own result entry; one bad audit id does not fail the batch.
+
+        Raises:
+            ForbiddenError: If the user is not part of a certification body.
+            BadRequestError: If more than CERTIFICATE_BULK_MAX audits are submitted.
+        """
+        user_id = get_jwt_identity()
+        user = User.query.filter_by(id=user_id).first()
+        if not user.certification_body_id:
+            raise ForbiddenError(message="Only certification body managers can issue certifications")
+
+        audit_ids = list(dict.fromkeys(bulk_data['audit_ids']))
+        if len(audit_ids) > current_app.config['CERTIFICATE_BULK_MAX']:
+            raise BadRequestError(
+                message=f"At most {current_app.config['CERTIFICATE_BULK_MAX']} audits can be issued per request.")
+
+        audits = {audit.id: audit for audit in Audit.query.options(
+            joinedload(Audit.organization).selectinload(Organization.users)
+        ).filter(Audit.id.in_(audit_ids)).all()}
+        already_certified = {audit_id for audit_id, in db.session.query(Certification.audit_id).filter(
+            Certification.audit_id.in_(audit_ids), Certification.status == CertificationStatusEnum.ISSUED)}
+
+        results, certifications = [], []
+        for audit_id in audit_ids:
+            audit = audits.get(audit_id)
+            if not audit:
+                results.append({"audit_id": audit_id, "status": "rejected", "error": "Audit not found"})
+            elif audit.certification_body_id != user.certification_body_id:
+                results.append({"audit_id": audit_id, "status": "rejected",
+                                "error": "Audit belongs to another certification body"})
+            elif audit.status != AuditStatusEnum.COMPLETED:
+                results.append({"audit_id": audit_id, "status": "rejected",
+                                "error": "Audit must be completed before issuing certification."})
+            elif audit_id in already_certified:
+                results.append({"audit_id": audit_id, "status": "rejected",
+                                "error": "Audit already has an issued certification"})
+            else:
+                certification = Certification(
+                    id=str(uuid.uuid4()),
+                    verification_code=generate_verification_code(),
+                    audit=audit,
+                    organization=audit.organization,
+                    certification_body_id=audit.certification_body_id,
+                    issued_date=bulk_data['issued_date'],
+                    status=CertificationStatusEnum.ISSUED,
+                    issuer_id=user_id,
+                    pdf_status=PdfStatusEnum.PENDING,
+                )
+                certifications.append(certification)
+                results.append({"audit_id": audit_id, "status": "issued", "certification": certification})
+
+        if certifications:
+            download_urls = [url_for('Certification.DownloadCertification', certificate_id=certification.id,
+                                     _external=True) for certification in certifications]
+            db.session.add_all(certifications)
+            if current_app.config['CERTIFICATE_RENDER_MODE'] == 'on_demand':
+                for certification, download_url in zip(certifications, download_urls):
+                    issue_on_demand(certification, download_url)
+            else:
+                render_certificates_in_pool(certifications, download_urls)
+            db.session.commit()
+
+        for result in results:
+            certification = result.pop("certification", None)
+            if certification is not None:
+                result["certification_id"] = certification.id
+                result["pdf_status"] = certification.pdf_status.value
+                result["error"] = certification.pdf_error
+        return {"issued": len(certifications), "rejected": len(results) - len(certifications), "results": results}
+
+
+@certification_bp.route('/certificates/export')
+class ExportCertifications(MethodView):
+    @jwt_required()
+    @roles_required(['manager'])
+    def get(self):
+        """Download every certificate of the user's organization as one ZIP, with a JSON manifest.
+
+        The archive is produced while it is sent, so memory use does not grow with the
+        number of certificates.
+
+        Raises:
+            ForbiddenError: If the user is not part of an organization.
+        """
+        user = User.query.get(get_jwt_identity())
+        if not user.organization_id:
+            raise ForbiddenError(message="Only organization managers can export certificates")
+        organization = user.organization
+
+        archive_name = (f"Certificates_{organization.name.replace(' ', '_')}_"
+                        f"{datetime.utcnow().strftime('%Y%m%d')}.zip")
+        response = current_app.response_class(
+            stream_with_context(stream_certificates_zip(organization, get_storage(), render_certificate_on_demand)),
+            mimetype='application/zip',
+        )
+        response.headers.set('Content-Disposition', 'attachment', filename=archive_name)
+        response.headers['Cache-Control'] = 'no-store'
+        return response
+
+
+@certification_bp.route('/certificates/<string:certificate_id>/status')
+class CertificationPdfStatus(MethodView):
+    @certification_bp.response(200, CertificationPdfStatusSchema)
+    @jwt_required()
+    def get(self, certificate_id):
+        """Report whether the certificate PDF has been rendered.
+
+        Raises:
+            NotFoundError: If the certification does not exist.
+            ForbiddenError: If the user lacks access to the certification.
+        """
+        certification = Certification.query.get(certificate_id)
+        if not certification:
+            raise NotFoundError(message="Certification not found")
+        user = User.query.get(get_jwt_identity())
+        if user.role != RoleEnum.ADMIN and user.organization_id != certification.organization_id \
+                and user.certification_body_id != certification.certification_body_id:
+            raise ForbiddenError(message="You do not have access to this certification")
+
+        download_url = None
+        if certification.pdf_status in (PdfStatusEnum.READY, PdfStatusEnum.ON_DEMAND):
+            download_url = url_for('Certification.DownloadCertification', certificate_id=certification.id,
+                                   _external=True)
+        return {
+            "id": certification.id,
+            "pdf_status": certification.pdf_status.value,
+            "pdf_error": certification.pdf_error,
+            "pdf_rendered_at": certification.pdf_rendered_at,
+            "download_url": download_url,
+        }
+
 
+@certification_bp.route('/certificates/<string:certificate_id>/revoke')
+class RevokeCertification(MethodView):
+    @certification_bp.arguments(CertificationRevokeSchema)
+    @certification_bp.response(200, CertificationSchema)
+    @jwt_required()
+    @roles_required(['admin', 'manager'])
+    def post(self, revoke_data, certificate_id):
+        """Revoke an issued certification and publish it on the revocation list.
+
+        Raises:
+            NotFoundError: If the certification does not exist.
+            ForbiddenError: If the user is not a manager of the issuing certification body.
+            ConflictError: If the certification is already revoked.
+        """
+        user = User.query.get(get_jwt_identity())
+        certification = Certification.query.get(certificate_id)
+        if not certification:
+            raise NotFoundError(message="Certification not found")
+        if user.role != RoleEnum.ADMIN and user.certification_body_id != certification.certification_body_id:
+            raise ForbiddenError(message="Only the issuing certification body can revoke this certification")
+        if certification.status == CertificationStatusEnum.REVOKED:
+            raise ConflictError(message="Certification is already revoked")
+
+        revoke_certification(certification, user, revoke_data['reason'])
+        db.session.commit()
+        invalidate_verification(certification)
         return certification
 
 
+@certification_bp.route('/revocations')
+class RevocationList(MethodView):
+    @certification_bp.arguments(RevocationListQuerySchema, location='query')
+    def get(self, query_args):
+        """Public list of revoked certificates' verification codes, versioned for incremental sync.
+
+        Without ``since`` the full sorted list is returned. With ``since=<version>`` only
+        certificates revoked after that version are listed. Either way ``version`` is
+        the value to send next time. Responses carry an ETag and may be cached for
+        REVOCATION_LIST_MAX_AGE seconds.
+        """
+        revocations = revocation_list(query_args['since'])
+        response = jsonify(revocations)
+        response.set_etag(f"rev-{revocations['version']}-{revocations['since']}")
+        response.headers['Cache-Control'] = f"public, max-age={current_app.config['REVOCATION_LIST_MAX_AGE']}"
+        return response.make_conditional(request)
+
+
+@certification_bp.route('/verify/<string:identifier>')
+class VerifyCertification(MethodView):
+    @certification_bp.response(200, CertificateVerificationSchema)
+    def get(self, identifier):
+        """Publicly check whether a certificate is genuine and still issued.
+
+        ``identifier`` is the certificate id or the verification code printed on the PDF.
+        No authentication is required and the PDF is never read. The answer never includes
+        the certificate id, which is what the download link is keyed by.
+
+        Raises:
+            NotFoundError: If no certificate matches.
+        """
+        verification = verify_certificate(identifier)
+        if verification is None:
+            raise NotFoundError(message="No certificate matches this id or verification code")
+        return verification, 200, {"Cache-Control": f"public, max-age={current_app.config['VERIFY_CACHE_TTL']}"}
+
+
 @certification_bp.route('/download/<string:certificate_id>')
 class DownloadCertification(MethodView):
     def get(self, certificate_id):
@@ -92,9 +311,72 @@ class DownloadCertification(MethodView):
         certification = Certification.query.get(certificate_id)
         if not certification:
             raise NotFoundError(message="Certification not found")
+        if certification.pdf_status not in (PdfStatusEnum.READY, PdfStatusEnum.ON_DEMAND):
+            raise ConflictError(message=f"Certificate PDF is {certification.pdf_status.value}, not ready for download")
+
+        download_name = (f"Certificate_{certification.organization.name.replace(' ', '_')}_"
+                         f"{certification.issued_date.strftime('%Y%m%d')}.pdf")
+        if certification.pdf_status == PdfStatusEnum.ON_DEMAND:
+            data, sha256 = render_certificate_on_demand(certification)
+            return send_file(io.BytesIO(data), mimetype='application/pdf', as_attachment=True,
+                             download_name=download_name, conditional=True, etag=sha256,
+                             last_modified=certification.created_at)
+
+        storage = get_storage()
+        local_path = storage.local_path(certification.certificate_pdf)
+        if local_path is None:
+            return _object_store_response(certification, storage, download_name)
+        offload_prefix = current_app.config['CERTIFICATE_ACCEL_REDIRECT_PREFIX']
+        if offload_prefix:
+            response = _accel_redirect_response(certification, local_path, offload_prefix, download_name)
+            if response is not None:
+                return response
 
+        # With USE_X_SENDFILE the proxy streams the file; otherwise the WSGI server's file
+        # wrapper (sendfile) does. Either way ETag/If-None-Match and Range requests are honoured.
         return send_file(
-            certification.certificate_pdf,
+            local_path,
+            mimetype='application/pdf',
             as_attachment=True,
-            download_name=f"certificates/Certificate_{certification.organization.name.replace(' ', '_')}_{datetime.utcnow().strftime('%Y%m%d')}.pdf"
-        )
\ No newline at end of file
+            download_name=download_name,
+            conditional=True,
+            etag=certification.pdf_sha256 or True,
+            last_modified=certification.pdf_rendered_at,
+        )
+
+
+def _object_store_response(certification, storage, download_name):
+    """
+    Redirect to a short-lived presigned URL so the object store serves the bytes
+    and range requests. A client that already holds the current ETag gets a 304.
+    """
+    if certification.pdf_sha256 and certification.pdf_sha256 in request.if_none_match:
+        response = current_app.response_class(status=304)
+    else:
+        response = redirect(storage.download_url(certification.certificate_pdf, download_name,
+                                                 current_app.config['CERTIFICATE_DOWNLOAD_URL_EXPIRES']))
+    if certification.pdf_sha256:
+        response.set_etag(certification.pdf_sha256)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+def _accel_redirect_response(certification, local_path, prefix, download_name):
+    """
+    Hand the transfer to nginx via ``X-Accel-Redirect``. ``prefix`` is an internal
+    location aliased to CERTIFICATE_STORAGE_ROOT, so nginx serves the bytes (and
+    ranges) itself. Returns None for files outside the storage root.
+    """
+    storage_root = os.path.realpath(current_app.config['CERTIFICATE_STORAGE_ROOT'])
+    file_path = os.path.realpath(local_path)
+    if os.path.commonpath([storage_root, file_path]) != storage_root:
+        return None
+
+    relative_path = os.path.relpath(file_path, storage_root).replace(os.sep, '/')
+    response = current_app.response_class(mimetype='application/pdf')
+    response.headers['X-Accel-Redirect'] = f"{prefix.rstrip('/')}/{quote(relative_path)}"
+    response.headers['Content-Disposition'] = attachment_disposition(download_name)
+    if certification.pdf_sha256:
+        response.set_etag(certification.pdf_sha256)
+    response.last_modified = certification.pdf_rendered_at
+    return response.make_conditional(request)
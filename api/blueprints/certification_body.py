@@ -138,12 +138,12 @@ class ApproveCertificationBodyRequest(MethodView):
             cert_body_request.status = RequestStatusEnum.APPROVED
             cert_body_request.admin_comment = review_data.get('admin_comment')
 
+            send_cert_body_approval_email(guest, certification_body)
             db.session.commit()
         except SQLAlchemyError:
             db.session.rollback()
             raise InternalServerError("An error occurred while approving the request.")
 
-        send_cert_body_approval_email(guest, certification_body)
         return {"message": "Certification body creation request approved and guest elevated to manager."}, 200
 
 
@@ -169,20 +169,20 @@ class RejectCertificationBodyRequest(MethodView):
         if cert_body_request.status != RequestStatusEnum.PENDING:
             raise BadRequestError("This request has already been processed.")
 
+        guest = User.query.get(cert_body_request.guest_id)
+        if not guest:
+            raise NotFoundError("Guest user not found.")
+
         cert_body_request.status = RequestStatusEnum.REJECTED
         cert_body_request.admin_comment = review_data.get('admin_comment')
 
         try:
+            send_cert_body_rejection_email(guest, cert_body_request)
             db.session.commit()
         except SQLAlchemyError:
             db.session.rollback()
             raise InternalServerError("An error occurred while rejecting the request.")
 
-        guest = User.query.get(cert_body_request.guest_id)
-        if not guest:
-            raise NotFoundError("Guest user not found.")
-
-        send_cert_body_rejection_email(guest, cert_body_request)
         return {"message": "Certification body creation request rejected."}, 200
 
 
@@ -257,13 +257,13 @@ class CertificationBodyInvite(MethodView):
         invitation.token = token
 
         try:
+            send_invitation_email(invitation, invitation.certification_body.name, 'CertificationBody',
+                                  is_new_user=not guest)
             db.session.commit()
         except SQLAlchemyError:
             db.session.rollback()
             raise InternalServerError("An error occurred while finalizing the invitation.")
 
-        send_invitation_email(invitation, invitation.certification_body.name, 'CertificationBody',
-                              is_new_user=not guest)
         return {"message": "Invitation sent successfully."}, 201
 
 
@@ -414,14 +414,14 @@ class AcceptInvitation(MethodView):
         invitation.is_used = True
         invitation.responded_at = datetime.utcnow()
 
+        certification_body = CertificationBody.query.get(invitation.certification_body_id)
         try:
+            send_cert_invitation_accepted_email(guest, certification_body)
             db.session.commit()
         except SQLAlchemyError:
             db.session.rollback()
             raise InternalServerError("An error occurred while accepting the invitation.")
 
-        certification_body = CertificationBody.query.get(invitation.certification_body_id)
-        send_cert_invitation_accepted_email(guest, certification_body)
         return {"message": f"Invitation accepted and role updated to {guest.role.value}."}, 200
 
     @certification_body_bp.response(200, MessageSchema)
@@ -482,14 +482,14 @@ class AcceptInvitation(MethodView):
         invitation.is_used = True
         invitation.responded_at = datetime.utcnow()
 
+        certification_body = CertificationBody.query.get(invitation.certification_body_id)
         try:
+            send_cert_invitation_accepted_email(guest, certification_body)
             db.session.commit()
         except SQLAlchemyError:
             db.session.rollback()
             raise InternalServerError("Error accepting invitation.")
 
-        certification_body = CertificationBody.query.get(invitation.certification_body_id)
-        send_cert_invitation_accepted_email(guest, certification_body)
         return {"message": f"Invitation accepted. Role updated to {guest.role.value}."}, 200
 
 
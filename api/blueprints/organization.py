@@ -113,12 +113,12 @@ class ApproveOrganizationRequest(MethodView):
             org_request.status = RequestStatusEnum.APPROVED
             org_request.admin_comment = review_data.get('admin_comment')
 
+            send_organization_approval_email(guest, organization)
             db.session.commit()
         except SQLAlchemyError:
             db.session.rollback()
             raise InternalServerError("An error occurred while approving the request.")
 
-        send_organization_approval_email(guest, organization)
         return {"message": "Organization creation request approved and guest elevated to manager."}, 200
 
 
@@ -137,20 +137,20 @@ class RejectOrganizationRequest(MethodView):
         if org_request.status != RequestStatusEnum.PENDING:
             raise BadRequestError("This request has already been processed.")
 
+        guest = User.query.get(org_request.guest_id)
+        if not guest:
+            raise NotFoundError("Guest user not found.")
+
         org_request.status = RequestStatusEnum.REJECTED
         org_request.admin_comment = review_data.get('admin_comment')
 
         try:
+            send_organization_rejection_email(guest, org_request)
             db.session.commit()
         except SQLAlchemyError:
             db.session.rollback()
             raise InternalServerError("An error occurred while rejecting the request.")
 
-        guest = User.query.get(org_request.guest_id)
-        if not guest:
-            raise NotFoundError("Guest user not found.")
-
-        send_organization_rejection_email(guest, org_request)
         return {"message": "Organization creation request rejected."}, 200
 
 
@@ -217,17 +217,15 @@ class UserInvite(MethodView):
         invitation.token = token
 
         try:
+            send_invitation_email(invitation, invitation.organization.name, 'Organization', is_new_user=not guest)
             db.session.commit()
         except SQLAlchemyError:
             db.session.rollback()
             raise InternalServerError("An error occurred while finalizing the invitation.")
 
         if guest:
-            send_invitation_email(invitation, invitation.organization.name, 'Organization', is_new_user=False)
             return {"message": "Invitation sent successfully to existing guest."}, 201
-        else:
-            send_invitation_email(invitation, invitation.organization.name, 'Organization')
-            return {"message": "Invitation sent successfully to register."}, 201
+        return {"message": "Invitation sent successfully to register."}, 201
 
 
 @organization_bp.route('/invitations')
@@ -332,14 +330,14 @@ class AcceptInvitation(MethodView):
         invitation.is_used = True
         invitation.responded_at = datetime.utcnow()
 
+        organization = Organization.query.get(invitation.organization_id)
         try:
+            send_invitation_accepted_email(guest, organization)
             db.session.commit()
         except SQLAlchemyError:
             db.session.rollback()
             raise InternalServerError("An error occurred while accepting the invitation.")
 
-        organization = Organization.query.get(invitation.organization_id)
-        send_invitation_accepted_email(guest, organization)
         return {"message": f"Invitation accepted and role updated to {guest.role.value}."}, 200
 
     @organization_bp.response(200, MessageSchema)
@@ -392,14 +390,14 @@ class AcceptInvitation(MethodView):
         invitation.is_used = True
         invitation.responded_at = datetime.utcnow()
 
+        organization = Organization.query.get(invitation.organization_id)
         try:
+            send_invitation_accepted_email(guest, organization)
             db.session.commit()
         except SQLAlchemyError:
             db.session.rollback()
             raise InternalServerError("Error accepting invitation.")
 
-        organization = Organization.query.get(invitation.organization_id)
-        send_invitation_accepted_email(guest, organization)
         return {"message": f"Invitation accepted. Role updated to {guest.role.value}."}, 200
 
 
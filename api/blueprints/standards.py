@@ -1,15 +1,22 @@
 from functools import lru_cache
 from math import ceil
 
+from bson import ObjectId
 from bson.errors import InvalidId
-from flask import request, current_app
+from flask import request, current_app, jsonify
 from flask.views import MethodView
 from flask_jwt_extended import jwt_required
 from flask_smorest import Blueprint, abort
+from itsdangerous import URLSafeSerializer, BadData
 from pymongo.errors import PyMongoError
 
-from api.models.mongodb_model import MongoDBClient
-from api.schemas.mongodb_schemas import ISOStandardSchema
+from api.models.mongodb_model import MongoDBClient, FILTER_FIELDS
+from api.schemas.mongodb_schemas import (ISOStandardSchema, ISOStandardDetailSchema, StandardFacetsSchema,
+                                         StandardSuggestionSchema)
+from api.utils.search_index import search_standards
+from api.utils.standards_utils import cached_standards_query, cached_standard_facets, cached_standard_detail, \
+    ACTIVE_STANDARDS
+from api.utils.suggest_utils import get_suggest_index
 from api.utils.utils import roles_required
 
 standards_bp = Blueprint('Standards', 'standards', url_prefix='/standards')
@@ -30,6 +37,10 @@ QUERY_PARAMS = {
     'ics': 'ics'
 }
 
+# Fields returned by list views unless ``fields=`` asks for others
+LIST_FIELDS = ('Iso', 'description', 'Category', 'stage', 'publication_date')
+COUNT_MODES = ('exact', 'estimate', 'none')
+
 
 def build_query():
     """Handle both URL params and JSON body"""
@@ -47,31 +58,128 @@ def build_query():
     for param, field in QUERY_PARAMS.items():
         if value := args.get(param):
             query[field] = value
-    query['is_active'] = {'$ne': True}
+    query.update(ACTIVE_STANDARDS)
 
     return query
 
 
+def _cursor_serializer():
+    return URLSafeSerializer(current_app.config['SECRET_KEY'], salt='standards-cursor')
+
+
+def encode_cursor(standard):
+    """Opaque token for the page after ``standard`` (the last one returned)."""
+    standard_id = standard['_id']
+    if isinstance(standard_id, ObjectId):
+        standard_id = {'$oid': str(standard_id)}
+    return _cursor_serializer().dumps([standard.get('Iso'), standard_id])
+
+
+def encode_offset_cursor(offset):
+    """Opaque token for a ranked page starting at ``offset``; ranks have no keyset."""
+    return _cursor_serializer().dumps({'offset': offset})
+
+
+def decode_cursor(cursor):
+    """
+    ``(after, offset)`` from a cursor: the ``(Iso, _id)`` key encoded by
+    ``encode_cursor`` and offset 0, or no key and the offset from
+    ``encode_offset_cursor``. Raises ValueError if tampered with.
+    """
+    try:
+        payload = _cursor_serializer().loads(cursor)
+        if isinstance(payload, dict):
+            return None, int(payload['offset'])
+        iso, standard_id = payload
+    except (BadData, TypeError, ValueError, KeyError):
+        raise ValueError("Invalid cursor")
+    if isinstance(standard_id, dict):
+        standard_id = ObjectId(standard_id['$oid'])
+    return (iso, standard_id), 0
+
+
+def list_projection():
+    """
+    Mongo projection for ``fields=`` (comma separated stored ISOStandardSchema fields),
+    defaulting to LIST_FIELDS. Iso and _id are always kept for the cursor.
+    """
+    requested = request.args.get('fields')
+    if requested:
+        fields = [field.strip() for field in requested.split(',') if field.strip()]
+        unknown = sorted(set(fields) - set(ISOStandardSchema().load_fields))
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    else:
+        fields = LIST_FIELDS
+    return {field: 1 for field in sorted({'Iso', *fields})}
+
+
+def page_limit():
+    limit = int(request.args.get('limit', current_app.config['STANDARDS_PAGE_SIZE']))
+    if limit < 1:
+        raise ValueError("limit must be a positive integer")
+    return min(limit, current_app.config['STANDARDS_MAX_PAGE_SIZE'])
+
+
 @standards_bp.route('/')
 class StandardsList(MethodView):
     @jwt_required()
     @standards_bp.response(200, ISOStandardSchema(many=True))
     def get(self):
-        """Optimized search with pagination and indexing"""
+        """
+        Optimized search with keyset pagination and indexing. Pass the previous
+        response's X-Next-Cursor as ``cursor`` for the next page; ``offset`` is
+        still accepted for the first pages but gets slower the deeper it goes.
+        ``count`` (exact, estimate or none) trades the total's accuracy for speed.
+        Keyword searches are ranked by relevance (``$text`` score, or the in-process
+        BM25 index with STANDARDS_SEARCH_ENGINE = 'bm25') and page by offset cursors.
+        """
         mongo = get_mongo_client()
         try:
             query = build_query()
-            offset = int(request.args.get('offset', 0))
-            limit = int(request.args.get('limit', 50))
+            projection = list_projection()
+            limit = page_limit()
+            cursor = request.args.get('cursor')
+            after, offset = decode_cursor(cursor) if cursor else (None, int(request.args.get('offset', 0)))
+            count = request.args.get('count', 'exact')
+            if count not in COUNT_MODES:
+                raise ValueError(f"count must be one of {', '.join(COUNT_MODES)}")
 
-            data = mongo.fetch_standards(
-                query=query,
-                skip=offset,
-                limit=limit
-            )
+            # Keyword results are ranked by relevance, so they page by offset rather than keyset
+            ranked = '$text' in query
+            if ranked and after is not None:
+                raise ValueError("Invalid cursor")
 
-            total_entries = mongo.count_standards(query)
-            headers = {'X-Total-Count': str(total_entries)}
+            # One extra document tells us whether there is a next page
+            if ranked and current_app.config['STANDARDS_SEARCH_ENGINE'] == 'bm25':
+                data, total_entries = search_standards(
+                    mongo,
+                    query['$text']['$search'],
+                    filters={field: value for field, value in query.items() if field in FILTER_FIELDS},
+                    projection=projection,
+                    skip=offset,
+                    limit=limit + 1
+                )
+                exact = True
+            else:
+                data, total_entries, exact = cached_standards_query(
+                    mongo,
+                    query,
+                    projection=projection,
+                    skip=offset,
+                    limit=limit + 1,
+                    after=after,
+                    count=count
+                )
+
+            has_more = len(data) > limit
+            headers = {'X-Has-More': str(has_more).lower()}
+            if total_entries is not None:
+                headers['X-Total-Count'] = str(total_entries)
+                headers['X-Total-Count-Exact'] = str(exact).lower()
+            if has_more:
+                data = data[:limit]
+                headers['X-Next-Cursor'] = encode_offset_cursor(offset + limit) if ranked else encode_cursor(data[-1])
             return data, 200, headers
 
         except PyMongoError as e:
@@ -81,8 +189,63 @@ class StandardsList(MethodView):
             abort(400, message=str(e))
 
 
-@standards_bp.route('/<string:standard_iso>')
+@standards_bp.route('/facets')
+class StandardFacets(MethodView):
+    @jwt_required()
+    @standards_bp.response(200, StandardFacetsSchema)
+    def get(self):
+        """Value counts per facet for the same keyword and filters as the list"""
+        mongo = get_mongo_client()
+        try:
+            return cached_standard_facets(mongo, build_query(), current_app.config['STANDARDS_FACET_LIMIT'])
+        except PyMongoError as e:
+            current_app.logger.error(f"MongoDB error: {str(e)}")
+            abort(500, message="Database operation failed")
+
+
+@standards_bp.route('/suggest')
+class StandardSuggest(MethodView):
+    @jwt_required()
+    @standards_bp.response(200, StandardSuggestionSchema(many=True))
+    def get(self):
+        """Typeahead over Iso numbers and titles, answered from an in-process prefix index"""
+        mongo = get_mongo_client()
+        try:
+            limit = int(request.args.get('limit', 10))
+            if limit < 1:
+                raise ValueError("limit must be a positive integer")
+            limit = min(limit, current_app.config['STANDARDS_SUGGEST_MAX_LIMIT'])
+            return get_suggest_index(mongo).search(request.args.get('q', ''), limit=limit)
+        except PyMongoError as e:
+            current_app.logger.error(f"MongoDB error: {str(e)}")
+            abort(500, message="Database operation failed")
+        except ValueError as e:
+            abort(400, message=str(e))
+
+
+# ``path`` because Iso numbers such as "ISO/IEC 27001:2022" contain slashes
+@standards_bp.route('/<path:standard_iso>')
 class StandardDetail(MethodView):
+    @jwt_required()
+    def get(self, standard_iso):
+        """
+        Full document for one standard by Iso number: a single indexed lookup,
+        cached per catalogue version and revalidated with its ETag.
+        """
+        mongo = get_mongo_client()
+        try:
+            detail = cached_standard_detail(mongo, standard_iso, ISOStandardDetailSchema().dump)
+        except PyMongoError as e:
+            current_app.logger.error(f"MongoDB error: {str(e)}")
+            abort(500, message="Database operation failed")
+        if detail is None:
+            abort(404, message="ISO standard not found")
+        document, etag = detail
+        response = jsonify(document)
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'private, no-cache'
+        return response.make_conditional(request)
+
     @standards_bp.response(200)
     @jwt_required()
     @roles_required('admin')
@@ -1,10 +1,12 @@
 from flask.views import MethodView
 from flask_jwt_extended import get_jwt_identity, jwt_required
 from flask_smorest import Blueprint
+from sqlalchemy.exc import SQLAlchemyError
 
-from api.errors import NotFoundError
-from api.models.models import User, Organization, CertificationBody
-from api.schemas.schemas import UserSchema
+from api.errors import NotFoundError, InternalServerError
+from api.extensions import db
+from api.models.models import User, Organization, CertificationBody, DigestFrequencyEnum
+from api.schemas.schemas import UserSchema, NotificationPreferenceSchema
 
 user_bp = Blueprint('User', 'user', url_prefix='/user')
 @user_bp.route('/profile')
@@ -22,6 +24,7 @@ class ProfileDetails(MethodView):
             "email": user.email,
             "full_name": user.full_name,
             "role": user.role.value,
+            "notification_digest": user.notification_digest.value,
             "created_at": user.created_at,
             "updated_at": user.updated_at,
         }
@@ -37,3 +40,32 @@ class ProfileDetails(MethodView):
 
         return response_data
 
+
+@user_bp.route('/notification-preferences')
+class NotificationPreferences(MethodView):
+    @jwt_required()
+    @user_bp.response(status_code=200, schema=NotificationPreferenceSchema)
+    def get(self):
+        """Get how often audit notifications are emailed: immediately, or as an hourly/daily digest."""
+        user = User.query.filter_by(id=get_jwt_identity()).first()
+        if not user:
+            raise NotFoundError("User not found.")
+        return {"notification_digest": user.notification_digest.value}
+
+    @jwt_required()
+    @user_bp.arguments(NotificationPreferenceSchema)
+    @user_bp.response(status_code=200, schema=NotificationPreferenceSchema)
+    def put(self, preference_data):
+        """Update the notification digest preference of the current user."""
+        user = User.query.filter_by(id=get_jwt_identity()).first()
+        if not user:
+            raise NotFoundError("User not found.")
+
+        user.notification_digest = DigestFrequencyEnum(preference_data['notification_digest'])
+        try:
+            db.session.commit()
+        except SQLAlchemyError:
+            db.session.rollback()
+            raise InternalServerError("An error occurred while updating notification preferences.")
+
+        return {"notification_digest": user.notification_digest.value}
@@ -0,0 +1,53 @@
+import click
+from flask.cli import AppGroup
+
+from api.blueprints.standards import QUERY_PARAMS, get_mongo_client
+from api.utils.outbox_utils import run_outbox_worker
+from api.utils.render_jobs import render_pending_certificates
+from api.utils.standards_utils import explain_standard_filters
+
+standards_cli = AppGroup('standards', help='Maintain the MongoDB standards catalogue.')
+
+
+@standards_cli.command('ensure-indexes')
+def ensure_indexes():
+    """Create the declared standards indexes; run on deploy, before serving traffic."""
+    mongo = get_mongo_client()
+    for name in mongo.ensure_indexes():
+        click.echo(f"Index {name} ready")
+    for name in mongo.undeclared_indexes():
+        click.echo(f"Warning: index {name} is not declared in STANDARDS_INDEXES")
+
+
+@standards_cli.command('check-indexes')
+def check_indexes():
+    """Explain each supported /standards/ filter and fail if any of them scans the collection."""
+    failed = False
+    for label, stages in explain_standard_filters(get_mongo_client(), QUERY_PARAMS.values()):
+        uses_index = 'COLLSCAN' not in stages
+        failed = failed or not uses_index
+        click.echo(f"{'ok  ' if uses_index else 'FAIL'} {label}: {' <- '.join(stages)}")
+    if failed:
+        raise click.ClickException("Some standards filters are not backed by an index; run `flask standards ensure-indexes`.")
+
+
+def register_commands(app):
+    """
+    Attach the management commands to the Flask CLI, e.g. ``flask --app run outbox-worker``.
+    Called once inside the application factory.
+    """
+    @app.cli.command('outbox-worker')
+    @click.option('--poll-interval', type=float, default=None, help='Seconds to sleep when the outbox is empty.')
+    @click.option('--once', is_flag=True, help='Exit once no message is due instead of polling forever.')
+    def outbox_worker(poll_interval, once):
+        """Deliver queued emails from the outbox with retries and backoff."""
+        run_outbox_worker(poll_interval=poll_interval, once=once)
+
+    @app.cli.command('render-certificates')
+    @click.option('--include-failed', is_flag=True, help='Also retry certifications whose last render failed.')
+    def render_certificates(include_failed):
+        """Render certificate PDFs still pending, e.g. jobs lost to a restart (email links use PUBLIC_BASE_URL)."""
+        rendered, failed = render_pending_certificates(include_failed=include_failed)
+        click.echo(f"Rendered {rendered} certificate(s), {failed} failed.")
+
+    app.cli.add_command(standards_cli)
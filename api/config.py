@@ -25,6 +25,39 @@ class Config:
     MAIL_USE_TLS = os.getenv('MAIL_USE_TLS', 'True') == 'True'
     MAIL_USE_SSL = os.getenv('MAIL_USE_SSL', 'False') == 'True'
     MAIL_DEFAULT_SENDER = os.getenv('MAIL_DEFAULT_SENDER', 'noreply@example.com')
+    MAIL_MAX_EMAILS = int(os.getenv('MAIL_MAX_EMAILS', 100))  # Messages sent per SMTP connection before it is recycled
+    OUTBOX_BATCH_SIZE = int(os.getenv('OUTBOX_BATCH_SIZE', 50))
+    OUTBOX_MAX_ATTEMPTS = int(os.getenv('OUTBOX_MAX_ATTEMPTS', 8))
+    OUTBOX_RETRY_BACKOFF = int(os.getenv('OUTBOX_RETRY_BACKOFF', 30))  # Seconds, doubled after each failure
+    OUTBOX_POLL_INTERVAL = float(os.getenv('OUTBOX_POLL_INTERVAL', 5))
+    DIGEST_HOURLY_WINDOW = int(os.getenv('DIGEST_HOURLY_WINDOW', 3600))  # Seconds
+    DIGEST_DAILY_WINDOW = int(os.getenv('DIGEST_DAILY_WINDOW', 86400))  # Seconds
+    DIGEST_CHECK_INTERVAL = int(os.getenv('DIGEST_CHECK_INTERVAL', 60))  # Seconds between digest sweeps
+    # 'async' (render pool), 'sync', or 'on_demand' (nothing stored; rendered into the cache on first download)
+    CERTIFICATE_RENDER_MODE = os.getenv('CERTIFICATE_RENDER_MODE', 'async')
+    CERTIFICATE_RENDER_WORKERS = int(os.getenv('CERTIFICATE_RENDER_WORKERS', 2))
+    CERTIFICATE_RENDER_PROCESSES = int(os.getenv('CERTIFICATE_RENDER_PROCESSES', 0)) or None  # None: one per CPU
+    CERTIFICATE_CACHE_MAX_BYTES = int(os.getenv('CERTIFICATE_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+    CERTIFICATE_DISK_CACHE_DIR = os.getenv('CERTIFICATE_DISK_CACHE_DIR', '')  # Empty: memory cache only
+    CERTIFICATE_DISK_CACHE_MAX_BYTES = int(os.getenv('CERTIFICATE_DISK_CACHE_MAX_BYTES', 1024 * 1024 * 1024))
+    VERIFY_CACHE_TTL = int(os.getenv('VERIFY_CACHE_TTL', 60))  # Seconds; also the public max-age
+    VERIFY_CACHE_MAX_ENTRIES = int(os.getenv('VERIFY_CACHE_MAX_ENTRIES', 10000))
+    REVOCATION_LIST_MAX_AGE = int(os.getenv('REVOCATION_LIST_MAX_AGE', 60))  # Seconds
+    # Internal nginx location aliased to CERTIFICATE_STORAGE_ROOT; when set, downloads return X-Accel-Redirect
+    CERTIFICATE_ACCEL_REDIRECT_PREFIX = os.getenv('CERTIFICATE_ACCEL_REDIRECT_PREFIX', '')
+    USE_X_SENDFILE = os.getenv('USE_X_SENDFILE', 'False') == 'True'  # Apache/lighttpd mod_xsendfile
+    CERTIFICATE_BULK_MAX = int(os.getenv('CERTIFICATE_BULK_MAX', 500))  # Audits per bulk issuance request
+    CERTIFICATE_STORAGE_BACKEND = os.getenv('CERTIFICATE_STORAGE_BACKEND', 'local')  # 'local' or 's3'
+    CERTIFICATE_STORAGE_ROOT = os.getenv(
+        'CERTIFICATE_STORAGE_ROOT', str(Path(__file__).resolve().parent.parent / 'certificates')
+    )
+    CERTIFICATE_S3_BUCKET = os.getenv('CERTIFICATE_S3_BUCKET')
+    CERTIFICATE_S3_PREFIX = os.getenv('CERTIFICATE_S3_PREFIX', 'certificates/')
+    CERTIFICATE_S3_ENDPOINT_URL = os.getenv('CERTIFICATE_S3_ENDPOINT_URL')  # e.g. MinIO or a moto server
+    CERTIFICATE_S3_REGION = os.getenv('CERTIFICATE_S3_REGION')
+    CERTIFICATE_DOWNLOAD_URL_EXPIRES = int(os.getenv('CERTIFICATE_DOWNLOAD_URL_EXPIRES', 300))  # Presigned URL lifetime
+    # Public URL of this API; emailed download links are built against it outside a request (CLI, workers)
+    PUBLIC_BASE_URL = os.getenv('PUBLIC_BASE_URL', 'https://localhost:5000')
     GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
     FRONTEND_URL = os.getenv('FRONTEND_URL')
     API_TITLE = "ISO Certifications API"
@@ -36,6 +69,17 @@ class Config:
     JWT_BLACKLIST_ENABLED = True
     JWT_BLACKLIST_TOKEN_CHECKS = ['access', 'refresh']
     MONGO_URI = os.getenv('MONGODB_URI')
+    STANDARDS_PAGE_SIZE = int(os.getenv('STANDARDS_PAGE_SIZE', 50))
+    STANDARDS_MAX_PAGE_SIZE = int(os.getenv('STANDARDS_MAX_PAGE_SIZE', 200))
+    STANDARDS_CACHE_TTL = int(os.getenv('STANDARDS_CACHE_TTL', 600))  # Seconds; the version stamp invalidates sooner
+    STANDARDS_CACHE_MAX_ENTRIES = int(os.getenv('STANDARDS_CACHE_MAX_ENTRIES', 512))
+    STANDARDS_COUNT_ESTIMATE_CAP = int(os.getenv('STANDARDS_COUNT_ESTIMATE_CAP', 1000))  # count=estimate stops here
+    # 'mongo' ranks keyword searches with $text; 'bm25' with the in-process BM25 index
+    STANDARDS_SEARCH_ENGINE = os.getenv('STANDARDS_SEARCH_ENGINE', 'mongo')
+    STANDARDS_SUGGEST_MAX_LIMIT = int(os.getenv('STANDARDS_SUGGEST_MAX_LIMIT', 25))
+    STANDARDS_VERSION_CHECK_INTERVAL = float(os.getenv('STANDARDS_VERSION_CHECK_INTERVAL', 5))  # Seconds
+    STANDARDS_CACHE_FACETS = os.getenv('STANDARDS_CACHE_FACETS', 'true').lower() == 'true'
+    STANDARDS_FACET_LIMIT = int(os.getenv('STANDARDS_FACET_LIMIT', 50))  # Values returned per facet
     API_SPEC_OPTIONS = {
         "file": str(Path(__file__).parent / "openapi.yml")  # Path to your YAML file
     }
@@ -1,3 +1,4 @@
+import secrets
 import uuid
 from datetime import datetime
 from enum import Enum
@@ -20,6 +21,13 @@ class CertificationStatusEnum(Enum):
     REVOKED = "revoked"
 
 
+class PdfStatusEnum(Enum):
+    PENDING = "pending"
+    READY = "ready"
+    FAILED = "failed"
+    ON_DEMAND = "on_demand"  # No stored file; rendered (and cached) when downloaded
+
+
 class RequestStatusEnum(Enum):
     PENDING = "pending"
     APPROVED = "approved"
@@ -32,6 +40,18 @@ class InvitationStatusEnum(Enum):
     DECLINED = "declined"
 
 
+class OutboxStatusEnum(Enum):
+    PENDING = "pending"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+class DigestFrequencyEnum(Enum):
+    IMMEDIATE = "immediate"
+    HOURLY = "hourly"
+    DAILY = "daily"
+
+
 class RoleEnum(Enum):
     ADMIN = 'admin'
     EMPLOYEE = 'employee'
@@ -42,6 +62,16 @@ class RoleEnum(Enum):
 
 # ------------------- Models -------------------
 
+# Crockford base32: no I, L, O or U, so codes survive being read aloud or retyped from paper.
+VERIFICATION_CODE_ALPHABET = '0123456789ABCDEFGHJKMNPQRSTVWXYZ'
+
+
+def generate_verification_code():
+    """A random code like ``7KQ2-M9XD-4TFA`` (60 bits), printed on the certificate."""
+    raw = ''.join(secrets.choice(VERIFICATION_CODE_ALPHABET) for _ in range(12))
+    return '-'.join(raw[i:i + 4] for i in range(0, 12, 4))
+
+
 class User(db.Model):
     __tablename__ = 'users'
 
@@ -53,6 +83,8 @@ class User(db.Model):
     organization_id = db.Column(db.String(36), db.ForeignKey('organizations.id'), nullable=True)
     certification_body_id = db.Column(db.String(36), db.ForeignKey('certification_bodies.id'), nullable=True)
     is_confirmed = db.Column(db.Boolean, default=False)
+    notification_digest = db.Column(db.Enum(DigestFrequencyEnum), nullable=False,
+                                    default=DigestFrequencyEnum.IMMEDIATE)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -117,7 +149,13 @@ class Certification(db.Model):
     certification_body_id = db.Column(db.String(36), db.ForeignKey('certification_bodies.id'), nullable=False)
     issued_date = db.Column(db.Date, nullable=False)
     status = db.Column(db.Enum(CertificationStatusEnum), nullable=False, default=CertificationStatusEnum.ISSUED)
-    certificate_pdf = db.Column(db.String, nullable=False)
+    certificate_pdf = db.Column(db.String, nullable=True)  # Storage key, set once the render job has saved the PDF
+    pdf_status = db.Column(db.Enum(PdfStatusEnum), nullable=False, default=PdfStatusEnum.PENDING, index=True)
+    pdf_sha256 = db.Column(db.String(64), nullable=True)
+    pdf_error = db.Column(db.Text, nullable=True)
+    pdf_rendered_at = db.Column(db.DateTime, nullable=True)
+    verification_code = db.Column(db.String(14), unique=True, index=True, nullable=True,
+                                  default=generate_verification_code)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -243,3 +281,62 @@ class CertificationBodyCreationRequest(db.Model):
 
     def __repr__(self):
         return f"<CertificationBodyCreationRequest {self.certification_body_name} by Guest {self.guest_id}>"
+
+
+class EmailOutbox(db.Model):
+    """
+    Outgoing email written in the same transaction as the change that triggered it.
+    Rows are delivered (and retried with backoff) by the outbox worker.
+    """
+    __tablename__ = 'email_outbox'
+
+    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    subject = db.Column(db.String(255), nullable=False)
+    sender = db.Column(db.String(120), nullable=True)
+    recipients = db.Column(db.Text, nullable=False)  # Comma-separated list of addresses
+    html = db.Column(db.Text, nullable=True)
+    body = db.Column(db.Text, nullable=True)
+    status = db.Column(db.Enum(OutboxStatusEnum), nullable=False, default=OutboxStatusEnum.PENDING, index=True)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    last_error = db.Column(db.Text, nullable=True)
+    next_attempt_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, index=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    sent_at = db.Column(db.DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<EmailOutbox {self.id} {self.status.value}>"
+
+
+class NotificationEvent(db.Model):
+    """
+    A notification buffered for a user who receives digests instead of one email per event.
+    Pending events (``digested_at`` is NULL) are coalesced into a single summary email.
+    """
+    __tablename__ = 'notification_events'
+    __table_args__ = (db.Index('ix_notification_events_user_pending', 'user_id', 'digested_at'),)
+
+    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False)
+    category = db.Column(db.String(50), nullable=False)
+    summary = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    digested_at = db.Column(db.DateTime, nullable=True)
+
+    user = relationship('User')
+
+
+class CertificationRevocation(db.Model):
+    """
+    One row per revoked certification. ``version`` is a monotonically increasing
+    sequence, so verifiers can fetch only the revocations newer than the last
+    version they synced.
+    """
+    __tablename__ = 'certification_revocations'
+
+    version = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    certification_id = db.Column(db.String(36), db.ForeignKey('certifications.id'), nullable=False, unique=True)
+    reason = db.Column(db.Text, nullable=True)
+    revoked_by_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False)
+    revoked_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    certification = relationship('Certification')
@@ -1,8 +1,29 @@
 from bson import ObjectId
 from flask import current_app
-from pymongo import MongoClient, TEXT
+from pymongo import MongoClient, TEXT, ASCENDING, IndexModel
 from pymongo.errors import PyMongoError, ConnectionFailure, OperationFailure
 
+# Stable page order; ``_id`` breaks ties between editions sharing an Iso number.
+STANDARDS_SORT = [('Iso', ASCENDING), ('_id', ASCENDING)]
+# Keyword ($text) searches put the best matches first, with the same tie-breaks
+TEXT_SCORE = {'$meta': 'textScore'}
+RELEVANCE_SORT = [('score', TEXT_SCORE), *STANDARDS_SORT]
+# Equality filters offered by /standards/ (the blueprint's QUERY_PARAMS)
+FILTER_FIELDS = ('Category', 'SubCategory', 'publication_date', 'stage', 'technical_committee', 'edition', 'ics')
+# Fields /standards/facets counts the values of
+FACET_FIELDS = ('Category', 'SubCategory', 'stage', 'technical_committee')
+# Applied by ``flask standards ensure-indexes``. Each filter index ends with the
+# page sort, so a filtered page is an index range scan with no in-memory sort.
+STANDARDS_INDEXES = [
+    IndexModel([('Iso', TEXT), ('Category', TEXT), ('SubCategory', TEXT), ('description', TEXT)],
+               name='text_search_index'),
+    IndexModel(STANDARDS_SORT, name='iso_id_sort_index'),
+    *(IndexModel([(field, ASCENDING), *STANDARDS_SORT], name=f'{field}_iso_id_index') for field in FILTER_FIELDS),
+]
+# One {'_id': <collection>, 'version': n} document per catalogue collection. The
+# scraper's MongoPipeline bumps it too, so keep the name in sync there.
+CATALOGUE_VERSIONS = 'catalogue_versions'
+
 
 class MongoDBClient:
     _instance = None
@@ -19,32 +40,32 @@ class MongoDBClient:
         self.client = MongoClient(current_app.config['MONGO_URI'])
         self.db = self.client['iso']
         self.standards = self.db['ISO']
+        self.catalogue_versions = self.db[CATALOGUE_VERSIONS]
 
-        index_name = "text_search_index"
-        index_fields = [
-            ('Iso', TEXT),
-            ('Category', TEXT),
-            ('SubCategory', TEXT),
-            ('description', TEXT)
-        ]
-
+    def ensure_indexes(self):
+        """Create any of STANDARDS_INDEXES that are missing; returns the declared index names"""
         try:
-            existing_indexes = self.standards.index_information()
-            if index_name not in existing_indexes:
-                self.standards.create_index(
-                    index_fields,
-                    name=index_name,
-                    background=True
-                )
-                print(f"Created new index: {index_name}")
-            else:
-                print(f"Index {index_name} already exists")
-
+            return self.standards.create_indexes(STANDARDS_INDEXES)
         except OperationFailure as e:
-            if "already exists with a different name" in str(e):
-                print("Warning: Duplicate index with different name exists")
-            else:
-                raise RuntimeError(f"Index creation failed: {str(e)}")
+            raise RuntimeError(f"Index creation failed: {str(e)}")
+
+    def undeclared_indexes(self):
+        """Indexes on the collection that STANDARDS_INDEXES does not declare"""
+        declared = {index.document['name'] for index in STANDARDS_INDEXES}
+        return sorted(set(self.standards.index_information()) - declared - {'_id_'})
+
+    def explain_standards(self, query):
+        """Winning query plan for a /standards/ page query"""
+        projection, sort = self._page_order(query, None)
+        return self.standards.find(filter=query, projection=projection, sort=sort, limit=1) \
+            .explain()['queryPlanner']['winningPlan']
+
+    @staticmethod
+    def _page_order(query, projection):
+        """Projection and sort for a page: by relevance (with a ``score`` field) for $text queries"""
+        if '$text' not in query:
+            return projection, STANDARDS_SORT
+        return dict(projection or {}, score=TEXT_SCORE), RELEVANCE_SORT
 
     @staticmethod
     def _handle_errors(func):
@@ -63,26 +84,122 @@ class MongoDBClient:
 
         return wrapper
     @_handle_errors
-    def fetch_standards(self, query=None, projection=None, skip=0, limit=10):
-        """Safe query execution with pagination"""
+    def fetch_standards(self, query=None, projection=None, skip=0, limit=10, after=None):
+        """Safe query execution with pagination, resuming after the ``(Iso, _id)`` in ``after``"""
         query = query or {}
+        projection, sort = self._page_order(query, projection)
+        if after is not None:
+            query = {'$and': [query, self._after(after)]}
 
         return list(self.standards.find(
             filter=query,
             projection=projection,
+            sort=sort,
             skip=skip,
             limit=limit
         ))
 
     @_handle_errors
-    def count_standards(self, query=None):
-        """Count documents matching the query"""
+    def fetch_standards_with_total(self, query=None, projection=None, skip=0, limit=10, after=None):
+        """``(page, total)`` for a query from a single aggregation"""
+        query = query or {}
+        pipeline = [{'$match': query}]
+        sort = dict(STANDARDS_SORT)
+        if '$text' in query:
+            pipeline.append({'$addFields': {'score': TEXT_SCORE}})
+            sort = {'score': -1, **sort}
+            projection = dict(projection, score=1) if projection else projection
+
+        page = [{'$match': self._after(after)}] if after is not None else []
+        page += [{'$sort': sort}, {'$skip': skip}, {'$limit': limit}]
+        if projection:
+            page.append({'$project': projection})
+        pipeline.append({'$facet': {'page': page, 'total': [{'$count': 'count'}]}})
+
+        result = next(self.standards.aggregate(pipeline, allowDiskUse=True), {})
+        total = result.get('total') or [{'count': 0}]
+        return result.get('page', []), total[0]['count']
+
+    @staticmethod
+    def _after(after):
+        """Filter for documents past the ``(Iso, _id)`` keyset position ``after``"""
+        iso, last_id = after
+        if iso is None:
+            # Null and missing Iso sort first, but {'$gt': None} matches nothing; the strings come next
+            return {'$or': [
+                {'Iso': None, '_id': {'$gt': last_id}},
+                {'Iso': {'$type': 'string'}},
+            ]}
+        return {'$or': [
+            {'Iso': {'$gt': iso}},
+            {'Iso': iso, '_id': {'$gt': last_id}},
+        ]}
+
+    @_handle_errors
+    def fetch_standards_by_ids(self, standard_ids, projection=None):
+        """Standards with the given ``_id``s, in no particular order"""
+        return list(self.standards.find(filter={'_id': {'$in': list(standard_ids)}}, projection=projection))
+
+    @_handle_errors
+    def iter_standards(self, query=None, projection=None, batch_size=1000):
+        """Cursor over every matching standard, for building in-process indexes"""
+        return self.standards.find(filter=query or {}, projection=projection, batch_size=batch_size)
+
+    @_handle_errors
+    def count_standards(self, query=None, limit=None):
+        """Count documents matching the query, stopping at ``limit`` if given"""
         query = query or {}
+        if limit:
+            return self.standards.count_documents(query, limit=limit)
         return self.standards.count_documents(query)
+
+    @_handle_errors
+    def facet_standards(self, query=None, limit=50):
+        """Total and per-value counts of each FACET_FIELDS field for the query"""
+        query = query or {}
+        facets = {
+            field: [
+                {'$group': {'_id': f'${field}', 'count': {'$sum': 1}}},
+                {'$sort': {'count': -1, '_id': 1}},
+                {'$limit': limit}
+            ]
+            for field in FACET_FIELDS
+        }
+        facets['total'] = [{'$count': 'count'}]
+
+        result = next(self.standards.aggregate([{'$match': query}, {'$facet': facets}]), {})
+        total = result.get('total') or [{'count': 0}]
+        return {
+            'total': total[0]['count'],
+            'facets': {
+                field: [{'value': bucket['_id'], 'count': bucket['count']} for bucket in result.get(field, [])]
+                for field in FACET_FIELDS
+            }
+        }
+
+    @_handle_errors
+    def estimate_standards(self):
+        """Collection size from its metadata, without scanning"""
+        return self.standards.estimated_document_count()
+
+    @_handle_errors
+    def catalogue_version(self):
+        """Stamp bumped on every catalogue write; cached query results are keyed by it"""
+        stamp = self.catalogue_versions.find_one({'_id': self.standards.name})
+        return stamp['version'] if stamp else 0
+
+    def bump_catalogue_version(self):
+        self.catalogue_versions.update_one(
+            {'_id': self.standards.name},
+            {'$inc': {'version': 1}},
+            upsert=True
+        )
+
     @_handle_errors
     def insert_standard(self, standard_data):
         """Insert with server-side validation"""
         result = self.standards.insert_one(standard_data)
+        self.bump_catalogue_version()
         return self.standards.find_one({'_id': result.inserted_id})
 
     @_handle_errors
@@ -92,8 +209,15 @@ class MongoDBClient:
             {'Iso': standard_iso},
             {'$set': {'is_active': False}}
         )
+        if result.matched_count:
+            self.bump_catalogue_version()
         return result.matched_count > 0
 
+    @_handle_errors
+    def find_standard_by_iso(self, standard_iso, query=None):
+        """Full document for an Iso number; an equality prefix of iso_id_sort_index"""
+        return self.standards.find_one(dict(query or {}, Iso=standard_iso), sort=STANDARDS_SORT)
+
     @_handle_errors
     def find_standard_by_id(self, standard_id):
         """Safe ID-based lookup"""
@@ -1,4 +1,4 @@
-from marshmallow import Schema, fields
+from marshmallow import Schema, fields, validate
 
 
 class CertificationSchema(Schema):
@@ -8,7 +8,10 @@ class CertificationSchema(Schema):
     certification_body_id = fields.String(required=True)
     issued_date = fields.Date(required=True)
     status = fields.String(required=True)
-    certificate_pdf = fields.String(required=True)
+    certificate_pdf = fields.String(allow_none=True)
+    pdf_status = fields.Function(lambda obj: obj.pdf_status.value if obj.pdf_status else None, dump_only=True)
+    pdf_sha256 = fields.String(dump_only=True, allow_none=True)
+    verification_code = fields.String(dump_only=True, allow_none=True)
     created_at = fields.DateTime(dump_only=True, format="%d-%m-%Y")
     updated_at = fields.DateTime(dump_only=True, format="%d-%m-%Y")
     issuer_id = fields.String(required=True)
@@ -16,3 +19,48 @@ class CertificationSchema(Schema):
 class CertificationCreateSchema(Schema):
     audit_id = fields.String(required=True)
     issued_date = fields.String(required=True)
+
+
+class CertificationPdfStatusSchema(Schema):
+    id = fields.String(dump_only=True)
+    pdf_status = fields.String(dump_only=True)
+    pdf_error = fields.String(dump_only=True, allow_none=True)
+    pdf_rendered_at = fields.DateTime(dump_only=True, allow_none=True)
+    download_url = fields.String(dump_only=True, allow_none=True)
+
+
+class CertificationBulkCreateSchema(Schema):
+    audit_ids = fields.List(fields.String(), required=True, validate=validate.Length(min=1))
+    issued_date = fields.Date(required=True)
+
+
+class CertificationBulkItemSchema(Schema):
+    audit_id = fields.String(dump_only=True)
+    status = fields.String(dump_only=True)
+    certification_id = fields.String(dump_only=True, allow_none=True)
+    pdf_status = fields.String(dump_only=True, allow_none=True)
+    error = fields.String(dump_only=True, allow_none=True)
+
+
+class CertificationBulkResultSchema(Schema):
+    issued = fields.Integer(dump_only=True)
+    rejected = fields.Integer(dump_only=True)
+    results = fields.List(fields.Nested(CertificationBulkItemSchema), dump_only=True)
+
+
+class CertificateVerificationSchema(Schema):
+    verification_code = fields.String(dump_only=True, allow_none=True)
+    valid = fields.Boolean(dump_only=True)
+    status = fields.String(dump_only=True)
+    issued_date = fields.String(dump_only=True)
+    organization_name = fields.String(dump_only=True)
+    certification_body_name = fields.String(dump_only=True)
+    standard = fields.String(dump_only=True)
+
+
+class CertificationRevokeSchema(Schema):
+    reason = fields.String(load_default=None, validate=validate.Length(max=1000))
+
+
+class RevocationListQuerySchema(Schema):
+    since = fields.Integer(load_default=0, validate=validate.Range(min=0))
@@ -13,3 +13,26 @@ class ISOStandardSchema(Schema):
     technical_committee = fields.String(required=True, validate=validate.Length(min=1))
     ics = fields.String(required=True, validate=validate.Length(min=1))
     url = fields.String(required=True)
+    score = fields.Float(dump_only=True)  # Relevance, on keyword searches only
+
+
+class ISOStandardDetailSchema(ISOStandardSchema):
+    id = fields.Function(lambda standard: str(standard['_id']), dump_only=True)
+    abstract = fields.Raw(dump_only=True)
+    content = fields.Raw(dump_only=True)
+    is_active = fields.Boolean(dump_only=True)
+
+
+class FacetBucketSchema(Schema):
+    value = fields.String(allow_none=True)
+    count = fields.Integer()
+
+
+class StandardFacetsSchema(Schema):
+    total = fields.Integer()
+    facets = fields.Dict(keys=fields.String(), values=fields.List(fields.Nested(FacetBucketSchema)))
+
+
+class StandardSuggestionSchema(Schema):
+    Iso = fields.String()
+    description = fields.String()
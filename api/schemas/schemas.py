@@ -1,5 +1,5 @@
 from marshmallow import Schema, fields, validates, ValidationError, validate, pre_load
-from api.models.models import RoleEnum, CertificationBody
+from api.models.models import RoleEnum, CertificationBody, DigestFrequencyEnum
 
 
 class MessageSchema(Schema):
@@ -71,9 +71,15 @@ class UserSchema(Schema):
     created_at = fields.DateTime(dump_only=True, format="%d-%m-%Y")
     organization_name = fields.Str(dump_only=True, allow_none=True)
     certification_body_name = fields.Str(dump_only=True, allow_none=True)
+    notification_digest = fields.Str(dump_only=True)
     updated_at = fields.DateTime(dump_only=True, format="%d-%m-%Y")
 
 
+class NotificationPreferenceSchema(Schema):
+    notification_digest = fields.Str(required=True,
+                                     validate=validate.OneOf([frequency.value for frequency in DigestFrequencyEnum]))
+
+
 class UserRegistrationSchema(Schema):
     email = fields.Email(required=False)
     password = fields.Str(required=True, load_only=True)
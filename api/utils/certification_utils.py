@@ -1,61 +1,86 @@
-import os
+import hashlib
+import io
+from datetime import datetime
+
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
-from datetime import datetime
 
+from api.utils.storage import certificate_storage_key
 
-def generate_certificate_pdf(certificate_details):
-    """
-    Generate a PDF certificate with CertiPro styling theme.
-    Maintains original content while matching the provided design aesthetic.
-    """
-    certificates_dir = os.path.join(os.getcwd(), 'certificates')
-    os.makedirs(certificates_dir, exist_ok=True)
-    timestamp = datetime.utcnow().strftime('%Y%m%d')
-    filename = f"Certificate_{certificate_details['recipient_name'].replace(' ', '_')}_{timestamp}.pdf"
-    file_path = os.path.join(certificates_dir, filename)
 
-    c = canvas.Canvas(file_path, pagesize=A4)
-    width, height = A4
+PRIMARY_COLOR = "#2C3E50"
+SECONDARY_COLOR = "#3498DB"
+ACCENT_COLOR = "#7F8C8D"
 
-    primary_color = "#2C3E50"
-    secondary_color = "#3498DB"
-    accent_color = "#7F8C8D"
 
+def _draw_static_layout(c, width, height):
+    """Everything on the certificate that does not depend on the recipient."""
     # Background frame
-    c.setStrokeColor(primary_color)
+    c.setStrokeColor(PRIMARY_COLOR)
     c.setLineWidth(2)
     c.rect(30, 30, width - 60, height - 60)
     # Header section
-    c.setFillColor(secondary_color)
+    c.setFillColor(SECONDARY_COLOR)
     c.setFont("Helvetica-Bold", 28)
     c.drawCentredString(width / 2, height - 100, "CertiPro")
 
-    c.setFillColor(accent_color)
+    c.setFillColor(ACCENT_COLOR)
     c.setFont("Helvetica", 16)
     c.drawCentredString(width / 2, height - 130, "Certification Management, Simplified")
 
-    content_y = height - 200
-    c.setFillColor(primary_color)
+    c.setFillColor(PRIMARY_COLOR)
     c.setFont("Helvetica-Bold", 20)
-    c.drawCentredString(width / 2, content_y, "Compliance Certification")
-    c.setFillColor(secondary_color)
+    c.drawCentredString(width / 2, height - 200, "Compliance Certification")
+
+    c.setFillColor(ACCENT_COLOR)
+    c.setFont("Helvetica", 8)
+    c.drawCentredString(width / 2, 40, "CertiPro Certification Platform - ISO Management Made Simple")
+
+
+def render_certificate_pdf(certificate_details):
+    """
+    Render the certificate PDF with CertiPro styling theme and return its bytes.
+
+    Output is deterministic: ReportLab's invariant mode pins the creation date and
+    document ID, and the issue date comes from ``certificate_details`` rather than
+    the clock, so identical details always produce identical bytes.
+    """
+    buffer = io.BytesIO()
+    c = canvas.Canvas(buffer, pagesize=A4, invariant=1)
+    width, height = A4
+    _draw_static_layout(c, width, height)
+
+    content_y = height - 200
+    c.setFillColor(SECONDARY_COLOR)
     c.setFont("Helvetica-Bold", 18)
     c.drawCentredString(width / 2, content_y - 60, certificate_details['recipient_name'])
 
-    c.setFillColor(primary_color)
+    c.setFillColor(PRIMARY_COLOR)
     c.setFont("Helvetica", 14)
     c.drawCentredString(width / 2, content_y - 130, f"Standard: {''.join(certificate_details['checklist'])}")
 
-
-    c.setFillColor(accent_color)
+    c.setFillColor(ACCENT_COLOR)
     c.setFont("Helvetica", 12)
-    issued_date = datetime.utcnow().strftime('%Y-%m-%d')
-    c.drawCentredString(width / 2, height - 300, f"Issued on: {issued_date}")
-    c.setFillColor(accent_color)
-    c.setFont("Helvetica", 8)
-    c.drawCentredString(width / 2, 40, "CertiPro Certification Platform - ISO Management Made Simple")
+    issued_date = certificate_details.get('issued_date') or datetime.utcnow().date()
+    c.drawCentredString(width / 2, height - 300, f"Issued on: {issued_date.strftime('%Y-%m-%d')}")
+    if certificate_details.get('verification_code'):
+        c.setFont("Helvetica", 10)
+        c.drawCentredString(width / 2, 60, f"Verification code: {certificate_details['verification_code']}")
 
     c.save()
+    return buffer.getvalue()
+
 
-    return file_path
\ No newline at end of file
+def generate_certificate_pdf(certificate_id, certificate_details, storage):
+    """
+    Render the PDF for ``certificate_id``, save it to ``storage`` and return ``(storage_key, sha256)``.
+
+    Keys are addressed by certificate id and content hash, so a re-render of the
+    same details finds its file already in place and writes nothing.
+    """
+    data = render_certificate_pdf(certificate_details)
+    sha256 = hashlib.sha256(data).hexdigest()
+    key = certificate_storage_key(certificate_id, sha256)
+    if not storage.exists(key):
+        storage.save(key, data)
+    return key, sha256
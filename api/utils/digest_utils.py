@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta
+
+from flask import current_app
+from sqlalchemy import func
+
+from api.extensions import db
+from api.models.models import NotificationEvent, User, DigestFrequencyEnum
+from api.utils.email_utils import send_notification_digest
+
+
+def digest_window(frequency):
+    """Buffering window for a digest frequency; users back on IMMEDIATE are flushed right away."""
+    if frequency == DigestFrequencyEnum.HOURLY:
+        return timedelta(seconds=current_app.config['DIGEST_HOURLY_WINDOW'])
+    if frequency == DigestFrequencyEnum.DAILY:
+        return timedelta(seconds=current_app.config['DIGEST_DAILY_WINDOW'])
+    return timedelta(0)
+
+
+def send_due_digests(now=None):
+    """
+    Queue a summary email for every user whose oldest pending notification has
+    waited out their digest window, and return the number of digests queued.
+
+    Due users are found with one grouped query; each digest is then built from the
+    user's pending events, claimed with ``FOR UPDATE SKIP LOCKED`` so concurrent
+    workers never put the same event in two digests.
+    """
+    now = now or datetime.utcnow()
+    oldest_pending = db.session.query(
+        NotificationEvent.user_id, func.min(NotificationEvent.created_at)
+    ).filter(NotificationEvent.digested_at.is_(None)).group_by(NotificationEvent.user_id).all()
+    if not oldest_pending:
+        return 0
+
+    oldest_by_user = dict(oldest_pending)
+    users = User.query.filter(User.id.in_(oldest_by_user)).all()
+
+    sent = 0
+    for user in users:
+        if oldest_by_user[user.id] + digest_window(user.notification_digest) > now:
+            continue
+        events = NotificationEvent.query.filter_by(
+            user_id=user.id, digested_at=None
+        ).order_by(NotificationEvent.created_at).with_for_update(skip_locked=True).all()
+        if not events:
+            continue
+        send_notification_digest(user, events)
+        for event in events:
+            event.digested_at = now
+        sent += 1
+
+    db.session.commit()
+    return sent
@@ -0,0 +1,102 @@
+import re
+import string
+from html.parser import HTMLParser
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemLoader
+from markupsafe import Markup, escape
+
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / 'templates' / 'email'
+
+
+class _Slot(Markup):
+    """A per-recipient placeholder that survives the shared render untouched."""
+
+
+class _RecipientSlots:
+    """Exposed to templates as ``recipient``: ``{{ recipient.full_name }}`` renders ``${full_name}``."""
+
+    def __getattr__(self, name):
+        return _Slot(f'${{{name}}}')
+
+
+def _finalize(value):
+    # Shared values are escaped for string.Template so only the recipient slots are substituted later.
+    if isinstance(value, _Slot):
+        return value
+    if isinstance(value, Markup):
+        return Markup(str(value).replace('$', '$$'))
+    return str(value).replace('$', '$$')
+
+
+# Templates are compiled on first use and kept for the life of the process (no mtime checks).
+_env = Environment(
+    loader=FileSystemLoader(TEMPLATE_DIR),
+    autoescape=True,
+    finalize=_finalize,
+    auto_reload=False,
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
+
+
+class _TextExtractor(HTMLParser):
+    PARAGRAPH_TAGS = {'p', 'div', 'ul', 'tr', 'h1', 'h2', 'h3'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self._href = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.PARAGRAPH_TAGS:
+            self.parts.append('\n\n')
+        elif tag == 'br':
+            self.parts.append('\n')
+        elif tag == 'li':
+            self.parts.append('\n- ')
+        elif tag == 'a':
+            self._href = dict(attrs).get('href')
+
+    def handle_endtag(self, tag):
+        if tag in self.PARAGRAPH_TAGS:
+            self.parts.append('\n\n')
+        elif tag == 'a' and self._href:
+            self.parts.append(f' ({self._href})')
+            self._href = None
+
+    def handle_data(self, data):
+        self.parts.append(re.sub(r'\s+', ' ', data))
+
+
+def html_to_text(html):
+    """Plain-text alternative of a rendered email: block elements become lines, links keep their URL."""
+    parser = _TextExtractor()
+    parser.feed(html)
+    parser.close()
+    lines = [re.sub(r' +', ' ', line).strip() for line in ''.join(parser.parts).splitlines()]
+    text = '\n'.join(lines)
+    return re.sub(r'\n{3,}', '\n\n', text).strip() + '\n'
+
+
+class RenderedEmail:
+    """
+    The shared part of an email, rendered once per broadcast.
+    Only the ``recipient`` fields are filled in for each addressee.
+    """
+
+    def __init__(self, html):
+        self._html = string.Template(html)
+        self._text = string.Template(html_to_text(html))
+
+    def for_recipient(self, **fields):
+        """Return ``(html, text)`` with the per-recipient fields substituted."""
+        html = self._html.substitute({key: escape(value) for key, value in fields.items()})
+        text = self._text.substitute(fields)
+        return html, text
+
+
+def render_email(template_name, **context):
+    """Render ``template_name`` with the shared ``context``, leaving ``recipient.*`` fields as slots."""
+    template = _env.get_template(template_name)
+    return RenderedEmail(template.render(recipient=_RecipientSlots(), **context))
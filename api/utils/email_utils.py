@@ -1,225 +1,127 @@
-from flask import url_for, current_app
+from email.utils import formataddr
+
+from flask import url_for, current_app, has_request_context
 from flask_mail import Message
 
-from api.extensions import mail
+from api.extensions import db
+from api.models.models import EmailOutbox, NotificationEvent, DigestFrequencyEnum
+from api.utils.email_templates import render_email
+
+
+def queue_email(msg):
+    """
+    Persist ``msg`` to the email outbox instead of sending it inline.
+
+    The row is only added to the current session, so it is committed (or rolled back)
+    together with the business change; the outbox worker performs the SMTP delivery.
+    """
+    entry = EmailOutbox(
+        subject=msg.subject,
+        sender=formataddr(msg.sender) if isinstance(msg.sender, tuple) else msg.sender,
+        recipients=", ".join(msg.recipients),
+        html=msg.html,
+        body=msg.body,
+    )
+    db.session.add(entry)
+    return entry
+
+
+def _queue_rendered(subject, recipients, rendered, **recipient_fields):
+    """Fill in the per-recipient fields of ``rendered`` and queue the html + text message."""
+    html, text = rendered.for_recipient(**recipient_fields)
+    msg = Message(subject=subject, recipients=recipients, html=html, body=text)
+    return queue_email(msg)
+
+
+def _buffer_for_digest(users, category, summary):
+    """
+    Record a NotificationEvent for every user on a digest schedule and return
+    the users who still want this notification emailed immediately.
+    """
+    immediate = []
+    for user in users:
+        if user.notification_digest in (None, DigestFrequencyEnum.IMMEDIATE):
+            immediate.append(user)
+        else:
+            db.session.add(NotificationEvent(user_id=user.id, category=category, summary=summary))
+    return immediate
+
+
+DIGEST_SECTIONS = {
+    'audit_request': 'Audit requests awaiting your decision',
+    'audit_request_response': 'Decisions on your audit requests',
+}
+
+
+def send_notification_digest(user, events):
+    """Queue one summary email covering all of ``events`` for ``user``."""
+    sections = {}
+    for event in events:
+        sections.setdefault(DIGEST_SECTIONS.get(event.category, 'Other notifications'), []).append(event.summary)
+    subject = f"Your notification summary: {len(events)} update{'s' if len(events) != 1 else ''}"
+    rendered = render_email('notification_digest.html', sections=sections)
+    return _queue_rendered(subject, [user.email], rendered, full_name=user.full_name)
 
 
 def send_cert_body_approval_email(user, certification_body):
     subject = 'Your Certification Body Creation Request Has Been Approved'
-    body = f"""
-    <html>
-      <body style="font-family: Arial, sans-serif; line-height: 1.6; max-width: 600px; margin: 0 auto;">
-        <p style="font-size: 16px; color: #333;">Hello <strong>{user.full_name}</strong>,</p>
-
-        <div style="background: #f8f9fa; padding: 20px; border-radius: 8px;">
-          <p style="margin: 0;">
-            Your request to create the certification body<br>
-            <strong style="color: #2c3e50; font-size: 18px;">{certification_body.name}</strong><br>
-            has been approved. You have been elevated to a manager role.
-          </p>
-        </div>
-
-        <p style="margin-top: 25px; color: #666;">
-          Best regards,<br>
-          <strong style="color: #2c3e50;">Admin Team</strong>
-        </p>
-      </body>
-    </html>
-    """
-    msg = Message(subject=subject, recipients=[user.email], html=body)
-    mail.send(msg)
+    rendered = render_email('request_approved.html', entity_kind='certification body',
+                            requested_name=certification_body.name)
+    _queue_rendered(subject, [user.email], rendered, full_name=user.full_name)
 
 
 def send_cert_body_rejection_email(user, cert_body_request):
     subject = 'Your Certification Body Creation Request Has Been Rejected'
-    body = f"""
-    <html>
-      <body style="font-family: Arial, sans-serif; line-height: 1.6; max-width: 600px; margin: 0 auto;">
-        <p style="font-size: 16px; color: #333;">Hello <strong>{user.full_name}</strong>,</p>
-
-        <div style="background: #fff3f3; padding: 20px; border-radius: 8px;">
-          <p style="margin: 0;">
-            We regret to inform you that your request to create<br>
-            <strong style="color: #c0392b; font-size: 18px;">{cert_body_request.certification_body_name}</strong><br>
-            has been rejected.
-          </p>
-
-          <div style="margin-top: 15px; padding: 12px; background: #fff; border-radius: 4px;">
-            <p style="margin: 0; color: #666;">
-              <strong>Comments:</strong><br>
-              {cert_body_request.admin_comment or 'No comments provided'}
-            </p>
-          </div>
-        </div>
-
-        <p style="margin-top: 25px; color: #666;">
-          If you have any questions, please contact the admin team.<br><br>
-          Best regards,<br>
-          <strong style="color: #2c3e50;">Admin Team</strong>
-        </p>
-      </body>
-    </html>
-    """
-    msg = Message(subject=subject, recipients=[user.email], html=body)
-    mail.send(msg)
+    rendered = render_email('request_rejected.html', requested_name=cert_body_request.certification_body_name,
+                            admin_comment=cert_body_request.admin_comment)
+    _queue_rendered(subject, [user.email], rendered, full_name=user.full_name)
 
 
 def send_cert_invitation_accepted_email(user, certification_body):
     subject = 'Invitation Accepted'
-    body = f"""
-    <html>
-      <body style="font-family: Arial, sans-serif; line-height: 1.6; max-width: 600px; margin: 0 auto;">
-        <p style="font-size: 16px; color: #333;">Hello <strong>{user.full_name}</strong>,</p>
-
-        <div style="background: #e8f5e9; padding: 20px; border-radius: 8px;">
-          <p style="margin: 0; text-align: center;">
-            You have successfully joined<br>
-            <strong style="color: #2c3e50; font-size: 20px;">
-              {certification_body.name if certification_body else "the certification body"}
-            </strong><br>
-            as an <strong style="color: #27ae60;">{user.role.value}</strong>
-          </p>
-        </div>
-
-        <p style="margin-top: 25px; color: #666;">
-          Best regards,<br>
-          <strong style="color: #2c3e50;">Admin Team</strong>
-        </p>
-      </body>
-    </html>
-    """
-    msg = Message(subject=subject, recipients=[user.email], html=body)
-    mail.send(msg)
+    rendered = render_email('invitation_accepted.html',
+                            joined_name=certification_body.name if certification_body else "the certification body",
+                            role=user.role.value)
+    _queue_rendered(subject, [user.email], rendered, full_name=user.full_name)
 
 
 def send_organization_approval_email(user, organization):
     subject = 'Your Organization Creation Request Has Been Approved'
-    body = f"""
-    <html>
-      <body style="font-family: Arial, sans-serif; line-height: 1.6; max-width: 600px; margin: 0 auto;">
-        <p style="font-size: 16px; color: #333;">Hello <strong>{user.full_name}</strong>,</p>
-
-        <div style="background: #f8f9fa; padding: 20px; border-radius: 8px;">
-          <p style="margin: 0;">
-            Your request to create<br>
-            <strong style="color: #2c3e50; font-size: 20px;">{organization.name}</strong><br>
-            has been approved. You have been elevated to a manager role.
-          </p>
-        </div>
-
-        <p style="margin-top: 25px; color: #666;">
-          Best regards,<br>
-          <strong style="color: #2c3e50;">Admin Team</strong>
-        </p>
-      </body>
-    </html>
-    """
-    msg = Message(subject=subject, recipients=[user.email], html=body)
-    mail.send(msg)
+    rendered = render_email('request_approved.html', requested_name=organization.name)
+    _queue_rendered(subject, [user.email], rendered, full_name=user.full_name)
 
 
 def send_organization_rejection_email(user, org_request):
     subject = 'Your Organization Creation Request Has Been Rejected'
-    body = f"""
-    <html>
-      <body style="font-family: Arial, sans-serif; line-height: 1.6; max-width: 600px; margin: 0 auto;">
-        <p style="font-size: 16px; color: #333;">Hello <strong>{user.full_name}</strong>,</p>
-
-        <div style="background: #fff3f3; padding: 20px; border-radius: 8px;">
-          <p style="margin: 0;">
-            We regret to inform you that your request to create<br>
-            <strong style="color: #c0392b; font-size: 18px;">{org_request.organization_name}</strong><br>
-            has been rejected.
-          </p>
-
-          <div style="margin-top: 15px; padding: 12px; background: #fff; border-radius: 4px;">
-            <p style="margin: 0; color: #666;">
-              <strong>Comments:</strong><br>
-              {org_request.admin_comment or 'No comments provided'}
-            </p>
-          </div>
-        </div>
-
-        <p style="margin-top: 25px; color: #666;">
-          If you have any questions, please contact the admin team.<br><br>
-          Best regards,<br>
-          <strong style="color: #2c3e50;">Admin Team</strong>
-        </p>
-      </body>
-    </html>
-    """
-    msg = Message(subject=subject, recipients=[user.email], html=body)
-    mail.send(msg)
+    rendered = render_email('request_rejected.html', requested_name=org_request.organization_name,
+                            admin_comment=org_request.admin_comment)
+    _queue_rendered(subject, [user.email], rendered, full_name=user.full_name)
 
 
 def send_invitation_accepted_email(user, organization):
     subject = 'Invitation Accepted'
-    body = f"""
-    <html>
-      <body style="font-family: Arial, sans-serif; line-height: 1.6; max-width: 600px; margin: 0 auto;">
-        <p style="font-size: 16px; color: #333;">Hello <strong>{user.full_name}</strong>,</p>
-
-        <div style="background: #e8f5e9; padding: 20px; border-radius: 8px;">
-          <p style="margin: 0; text-align: center;">
-            You have successfully joined<br>
-            <strong style="color: #2c3e50; font-size: 20px;">{organization.name}</strong><br>
-            as an <strong style="color: #27ae60;">{user.role.value}</strong>
-          </p>
-        </div>
-
-        <p style="margin-top: 25px; color: #666;">
-          Best regards,<br>
-          <strong style="color: #2c3e50;">Admin Team</strong>
-        </p>
-      </body>
-    </html>
-    """
-    msg = Message(subject=subject, recipients=[user.email], html=body)
-    mail.send(msg)
+    rendered = render_email('invitation_accepted.html', joined_name=organization.name, role=user.role.value)
+    _queue_rendered(subject, [user.email], rendered, full_name=user.full_name)
+
 
+def certificate_download_url(certificate_id):
+    """External download link for a certificate, built against PUBLIC_BASE_URL outside a request."""
+    if has_request_context() or current_app.config.get('SERVER_NAME'):
+        return url_for('Certification.DownloadCertification', certificate_id=certificate_id, _external=True)
+    with current_app.test_request_context(base_url=current_app.config['PUBLIC_BASE_URL']):
+        return url_for('Certification.DownloadCertification', certificate_id=certificate_id, _external=True)
 
-def send_certification_email(certification):
+
+def send_certification_email(certification, download_url=None):
     subject = 'Your Compliance Certification Issued'
-    download_url = url_for(
-        'Certification.DownloadCertification',
-        certificate_id=certification.id,
-        _external=True
-    )
+    # Render jobs run outside the request, so the issuing request passes the link in.
+    download_url = download_url or certificate_download_url(certification.id)
     organization = certification.organization
     recipients = [user.email for user in organization.users]
-    body = f"""
-    <html>
-      <body style="font-family: Arial, sans-serif; line-height: 1.6; max-width: 600px; margin: 0 auto;">
-        <p style="font-size: 16px; color: #333;">Hello <strong>{organization.name} Team</strong>,</p>
-
-        <div style="background: #f8f9fa; padding: 20px; border-radius: 8px;">
-          <p style="margin: 0 0 15px 0;">
-            Congratulations! Your compliance certification for:<br>
-            <strong style="color: #2c3e50; font-size: 18px;">{certification.audit.name}</strong>
-          </p>
-          <p style="margin: 0;">
-            Issued on: <strong>{certification.issued_date}</strong>
-          </p>
-        </div>
-
-        <div style="text-align: center; margin: 25px 0;">
-          <a href="{download_url}" 
-             style="background: #27ae60; color: white; padding: 12px 25px; 
-                    text-decoration: none; border-radius: 5px; display: inline-block;">
-            Download Certification
-          </a>
-        </div>
-
-        <p style="color: #666; margin-top: 20px;">
-          Thank you for your dedication to maintaining high standards.<br><br>
-          Best regards,<br>
-          <strong style="color: #2c3e50;">Certification Team</strong>
-        </p>
-      </body>
-    </html>
-    """
-    msg = Message(subject=subject, recipients=recipients, html=body)
-    mail.send(msg)
+    rendered = render_email('certification_issued.html', organization_name=organization.name,
+                            audit_name=certification.audit.name, issued_date=certification.issued_date,
+                            download_url=download_url)
+    _queue_rendered(subject, recipients, rendered)
 
 
 def send_audit_notification(audit):
@@ -231,194 +133,38 @@ def send_audit_notification(audit):
         print("No users found to notify for this organization.")
         return
 
-    body = f"""
-    <html>
-      <body style="font-family: Arial, sans-serif; line-height: 1.6; max-width: 600px; margin: 0 auto;">
-        <p style="font-size: 16px; color: #333;">Hello Team,</p>
-
-        <div style="background: #e8f4fc; padding: 20px; border-radius: 8px;">
-          <p style="margin: 0 0 15px 0;">
-            New audit scheduled for:<br>
-            <strong style="color: #2c3e50; font-size: 20px;">{organization.name}</strong>
-          </p>
-          <div style="background: white; padding: 15px; border-radius: 4px;">
-            <p style="margin: 0;">
-              <strong>Audit Title:</strong> {audit.name}<br>
-              <strong>Scheduled Date:</strong> {audit.scheduled_date}
-            </p>
-          </div>
-        </div>
-
-        <p style="color: #666; margin-top: 25px;">
-          Please prepare accordingly.<br><br>
-          Best regards,<br>
-          <strong style="color: #2c3e50;">Audit Management</strong>
-        </p>
-      </body>
-    </html>
-    """
-    msg = Message(subject=subject, recipients=recipients, html=body)
-    mail.send(msg)
+    rendered = render_email('audit_notification.html', organization_name=organization.name,
+                            audit_name=audit.name, scheduled_date=audit.scheduled_date)
+    _queue_rendered(subject, recipients, rendered)
 
 
 def send_account_confirmation_email(user, confirmation_url):
     subject = "Confirm Your Email"
-    body = f"""
-    <html>
-      <body style="font-family: Arial, sans-serif; line-height: 1.6; max-width: 600px; margin: 0 auto;">
-        <p style="font-size: 16px; color: #333;">Hello <strong>{user.full_name}</strong>,</p>
-
-        <div style="background: #f8f9fa; padding: 20px; border-radius: 8px;">
-          <p style="margin: 0 0 15px 0;">Please confirm your email address:</p>
-          <a href="{confirmation_url}" 
-             style="background: #3498db; color: white; padding: 12px 25px; 
-                    text-decoration: none; border-radius: 5px; display: inline-block;">
-            Confirm Email
-          </a>
-        </div>
-
-        <p style="color: #666; margin-top: 25px;">
-          If you did not register for this account, please ignore this email.<br><br>
-          Best regards,<br>
-          <strong style="color: #2c3e50;">The Team</strong>
-        </p>
-      </body>
-    </html>
-    """
-    msg = Message(subject=subject, recipients=[user.email], html=body)
-    mail.send(msg)
+    rendered = render_email('account_confirmation.html', confirmation_url=confirmation_url)
+    _queue_rendered(subject, [user.email], rendered, full_name=user.full_name)
 
 
 def send_password_reset_email(user, reset_url):
     subject = "Password Reset Link"
-    body = f"""
-    <html>
-      <body style="font-family: Arial, sans-serif; line-height: 1.6; max-width: 600px; margin: 0 auto;">
-        <p style="font-size: 16px; color: #333;">Hello <strong>{user.full_name}</strong>,</p>
-
-        <div style="background: #fff3e0; padding: 20px; border-radius: 8px;">
-          <p style="margin: 0 0 15px 0;">Please reset your password:</p>
-          <a href="{reset_url}" 
-             style="background: #f39c12; color: white; padding: 12px 25px; 
-                    text-decoration: none; border-radius: 5px; display: inline-block;">
-            Reset Password
-          </a>
-          <p style="margin: 15px 0 0 0; color: #666; font-size: 14px;">
-            This link will expire in 1 hour.
-          </p>
-        </div>
-
-        <p style="color: #666; margin-top: 25px;">
-          If you didn't request this, please ignore this email.<br><br>
-          Best regards,<br>
-          <strong style="color: #2c3e50;">The Team</strong>
-        </p>
-      </body>
-    </html>
-    """
-    msg = Message(subject=subject, recipients=[user.email], html=body)
-    mail.send(msg)
+    rendered = render_email('password_reset.html', reset_url=reset_url)
+    _queue_rendered(subject, [user.email], rendered, full_name=user.full_name)
 
 
 def send_revocation_email(invitation, org_name):
     subject = f'Your invitation to Join {org_name} has been revoked'
-    body = f"""
-    <html>
-      <body style="font-family: Arial, sans-serif; line-height: 1.6; max-width: 600px; margin: 0 auto;">
-        <p style="font-size: 16px; color: #333;">Hello,</p>
-
-        <div style="background: #ffebee; padding: 20px; border-radius: 8px;">
-          <p style="margin: 0 0 15px 0;">
-            Your invitation to join<br>
-            <strong style="color: #c0392b; font-size: 18px;">{org_name}</strong><br>
-            as a <strong>{invitation.role.value}</strong> has been revoked.
-          </p>
-          <p style="margin: 0; color: #666;">
-            Please contact your manager for more information.
-          </p>
-        </div>
-
-        <p style="color: #666; margin-top: 25px;">
-          If you did not expect this invitation, please ignore this email.<br><br>
-          Best regards,<br>
-          <strong style="color: #2c3e50;">Your Company</strong>
-        </p>
-      </body>
-    </html>
-    """
-    msg = Message(subject=subject, recipients=[invitation.email], html=body)
-    mail.send(msg)
+    rendered = render_email('invitation_revoked.html', org_name=org_name, role=invitation.role.value)
+    _queue_rendered(subject, [invitation.email], rendered)
 
 
 def send_invitation_email(invitation, org_name, org_type, is_new_user=True):
     if is_new_user:
-        registration_link = f"https://127.0.0.1:5000/auth/register?token={invitation.token}"
-        subject = f'You are Invited to Join {org_name}'
-        body = f"""
-        <html>
-          <body style="font-family: Arial, sans-serif; line-height: 1.6; max-width: 600px; margin: 0 auto;">
-            <p style="font-size: 16px; color: #333;">Hello,</p>
-
-            <div style="background: #f8f9fa; padding: 20px; border-radius: 8px;">
-              <p style="margin: 0 0 15px 0;">
-                You've been invited as<br>
-                <strong style="color: #2c3e50; font-size: 18px;">{invitation.role.value}</strong>
-              </p>
-              <a href="{registration_link}" 
-                 style="background: #27ae60; color: white; padding: 12px 25px; 
-                        text-decoration: none; border-radius: 5px; display: inline-block;">
-                Accept Invitation
-              </a>
-              <p style="margin: 15px 0 0 0; color: #666;">
-                Expires: {invitation.expires_at.strftime('%Y-%m-%d')}
-              </p>
-            </div>
-
-            <p style="color: #666; margin-top: 25px;">
-              Best regards,<br>
-              <strong style="color: #2c3e50;">Your Company</strong>
-            </p>
-          </body>
-        </html>
-        """
+        link = f"https://127.0.0.1:5000/auth/register?token={invitation.token}"
     else:
-        acceptance_link = f"https://127.0.0.1:5000/organization/invitations/accept/?token={invitation.token}"
-        subject = f'You are Invited to Join {org_name}'
-        body = f"""
-        <html>
-          <body style="font-family: Arial, sans-serif; line-height: 1.6; max-width: 600px; margin: 0 auto;">
-            <p style="font-size: 16px; color: #333;">Hello,</p>
-
-            <div style="background: #f8f9fa; padding: 20px; border-radius: 8px;">
-              <p style="margin: 0 0 15px 0;">
-                Join <strong>{org_name}</strong> as<br>
-                <strong style="color: #2c3e50; font-size: 18px;">{invitation.role.value}</strong>
-              </p>
-              <a href="{acceptance_link}" 
-                 style="background: #3498db; color: white; padding: 12px 25px; 
-                        text-decoration: none; border-radius: 5px; display: inline-block;">
-                Accept Invitation
-              </a>
-              <div style="margin-top: 15px; color: #666; font-size: 14px;">
-                <p style="margin: 10px 0;">
-                  Expires: {invitation.expires_at.strftime('%Y-%m-%d %H:%M:%S')} UTC
-                </p>
-                <p style="margin: 10px 0;">
-                  Or send POST request with your token
-                </p>
-              </div>
-            </div>
-
-            <p style="color: #666; margin-top: 25px;">
-              Best regards,<br>
-              <strong style="color: #2c3e50;">Your Company</strong>
-            </p>
-          </body>
-        </html>
-        """
-
-    msg = Message(subject=subject, recipients=[invitation.email], html=body)
-    mail.send(msg)
+        link = f"https://127.0.0.1:5000/organization/invitations/accept/?token={invitation.token}"
+    subject = f'You are Invited to Join {org_name}'
+    rendered = render_email('invitation.html', is_new_user=is_new_user, org_name=org_name,
+                            role=invitation.role.value, link=link, expires_at=invitation.expires_at)
+    _queue_rendered(subject, [invitation.email], rendered)
 
 
 def send_audit_request_notification_to_cb_managers(audit_request, cb_managers):
@@ -426,49 +172,20 @@ def send_audit_request_notification_to_cb_managers(audit_request, cb_managers):
     Sends an email to each certification body manager about a new audit request.
     Each email contains links or instructions for approving or rejecting.
     """
+    summary = (f"{audit_request.organization.name} requested the audit \"{audit_request.name}\" "
+               f"scheduled for {audit_request.scheduled_date} ({audit_request.standard_ids}).")
+    cb_managers = _buffer_for_digest(cb_managers, 'audit_request', summary)
+    if not cb_managers:
+        return
+
+    action_url = url_for('Audit.AuditRequestAction', request_id=audit_request.id, _external=True)
+    subject = f"Audit Request Pending: {audit_request.name}"
+    rendered = render_email('audit_request_pending.html', organization_name=audit_request.organization.name,
+                            audit_name=audit_request.name, scheduled_date=audit_request.scheduled_date,
+                            standard_ids=audit_request.standard_ids,
+                            approve_url=action_url + "?decision=approve", reject_url=action_url + "?decision=reject")
     for manager in cb_managers:
-        approve_url = url_for('Audit.AuditRequestAction', request_id=audit_request.id,
-                              _external=True) + "?decision=approve"
-        reject_url = url_for('Audit.AuditRequestAction', request_id=audit_request.id,
-                             _external=True) + "?decision=reject"
-
-        subject = f"Audit Request Pending: {audit_request.name}"
-        body = f"""
-                   <html>
-                     <body style="font-family: Arial, sans-serif; line-height: 1.6; max-width: 600px; margin: 0 auto;">
-                       <p style="font-size: 16px; color: #333;">
-                         Hello <strong>{manager.full_name}</strong>,
-                       </p>
-    
-                       <div style="background: #f8f9fa; padding: 20px; border-radius: 8px;">
-                         <p style="margin: 0 0 15px 0;">
-                           The organization <strong style="color: #2c3e50;">{audit_request.organization.name}</strong> 
-                           has requested an audit:
-                         </p>
-                         <ul style="margin: 0 0 15px 0; padding-left: 18px; color: #555;">
-                           <li><strong>Audit Name:</strong> {audit_request.name}</li>
-                           <li><strong>Scheduled Date:</strong> {audit_request.scheduled_date}</li>
-                           <li><strong>Standards:</strong> {audit_request.standard_ids}</li>
-                         </ul>
-                         <p style="margin: 0 0 5px 0;">
-                           Please click on one of the links below to respond:
-                         </p>
-                         <p>
-                           <a href="{approve_url}" style="color: #27ae60; text-decoration: none; font-weight: 
-                           bold;">Approve Request</a> | <a href="{reject_url}" style="color: #c0392b; 
-                           text-decoration: none; font-weight: bold;">Reject Request</a>
-                         </p>
-                       </div>
-    
-                       <p style="margin-top: 25px; color: #666;">
-                         Best regards,<br>
-                         <strong style="color: #2c3e50;">Audit Management System</strong>
-                       </p>
-                     </body>
-                   </html>
-                   """
-        msg = Message(subject=subject, recipients=[manager.email], html=body)
-        mail.send(msg)
+        _queue_rendered(subject, [manager.email], rendered, full_name=manager.full_name)
 
 
 def send_audit_request_response_to_org_managers(audit_request, org_managers, approved=True):
@@ -476,69 +193,24 @@ def send_audit_request_response_to_org_managers(audit_request, org_managers, app
     Notifies the organization managers that their audit request has been approved or rejected.
     """
     status_text = "approved" if approved else "rejected"
+    summary = f"Your audit request \"{audit_request.name}\" was {status_text} by the Certification Body."
+    org_managers = _buffer_for_digest(org_managers, 'audit_request_response', summary)
+    if not org_managers:
+        return
 
+    subject = f"Your Audit Request Has Been {status_text.title()}"
+    rendered = render_email('audit_request_response.html', approved=approved, status_text=status_text,
+                            audit_name=audit_request.name)
     for manager in org_managers:
-        subject = f"Your Audit Request Has Been {status_text.title()}"
-        body = f"""
-        <html>
-          <body style="font-family: Arial, sans-serif; line-height: 1.6; max-width: 600px; margin: 0 auto;">
-            <p style="font-size: 16px; color: #333;">
-              Hello <strong>{manager.full_name}</strong>,
-            </p>
-
-            <div style="background: #{'e8f5e9' if approved else 'fff3f3'}; 
-                        padding: 20px; border-radius: 8px;">
-              <p style="margin: 0 0 15px 0;">
-                Your request for an audit 
-                <strong style="color: #2c3e50;">({audit_request.name})</strong> 
-                has been <strong style="color: #{'27ae60' if approved else 'c0392b'};">
-                  {status_text}
-                </strong> by the Certification Body.
-              </p>
-            </div>
-
-            <p style="margin-top: 25px; color: #666;">
-              If you have any questions, please contact your certification body manager.<br><br>
-              Best regards,<br>
-              <strong style="color: #2c3e50;">Audit Management System</strong>
-            </p>
-          </body>
-        </html>
-        """
-        msg = Message(subject=subject, recipients=[manager.email], html=body)
-        mail.send(msg)
+        _queue_rendered(subject, [manager.email], rendered, full_name=manager.full_name)
 
 
 def send_audit_created_notification(audit, organization_users):
     """
     Informs the entire organization that an audit was created.
     """
+    subject = f"Audit Scheduled: {audit.name}"
+    rendered = render_email('audit_created.html', organization_name=audit.organization.name,
+                            audit_name=audit.name, scheduled_date=audit.scheduled_date, checklist=audit.checklist)
     for user in organization_users:
-        subject = f"Audit Scheduled: {audit.name}"
-        body = f"""
-        <html>
-          <body style="font-family: Arial, sans-serif; line-height: 1.6; max-width: 600px; margin: 0 auto;">
-            <p style="font-size: 16px; color: #333;">Hello <strong>{user.full_name}</strong>,</p>
-
-            <div style="background: #e8f4fc; padding: 20px; border-radius: 8px;">
-              <p style="margin: 0 0 15px 0;">
-                A new audit has been scheduled for your organization 
-                <strong style="color: #2c3e50; font-size: 18px;">({audit.organization.name})</strong>:
-              </p>
-              <p style="margin: 0;">
-                <strong>Audit Title:</strong> {audit.name}<br>
-                <strong>Scheduled Date:</strong> {audit.scheduled_date}<br>
-                <strong>Checklist / Standards:</strong> {audit.checklist}
-              </p>
-            </div>
-
-            <p style="color: #666; margin-top: 25px;">
-              Please prepare accordingly.<br><br>
-              Best regards,<br>
-              <strong style="color: #2c3e50;">Audit Management System</strong>
-            </p>
-          </body>
-        </html>
-        """
-        msg = Message(subject=subject, recipients=[user.email], html=body)
-        mail.send(msg)
+        _queue_rendered(subject, [user.email], rendered, full_name=user.full_name)
@@ -0,0 +1,126 @@
+import json
+import zipfile
+from contextlib import closing
+from datetime import datetime
+
+from api.models.models import Certification, Audit, PdfStatusEnum
+
+CHUNK_SIZE = 64 * 1024
+
+
+class _DrainableBuffer:
+    """
+    Write-only, non-seekable sink for ``zipfile``. Because it cannot seek, ZipFile
+    writes data descriptors after each member instead of patching headers, so
+    the archive can be sent as it is produced; ``drain`` hands over what has
+    been written since the last call.
+    """
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _zip_info(name, date_time, compress_type):
+    info = zipfile.ZipInfo(name, date_time=date_time.timetuple()[:6])
+    info.compress_type = compress_type
+    info.external_attr = 0o644 << 16
+    return info
+
+
+def _certification_rows(organization_id, batch_size=100):
+    """All of an organization's certifications with their audit, streamed in batches."""
+    return Certification.query.join(Audit, Audit.id == Certification.audit_id).add_entity(Audit).filter(
+        Certification.organization_id == organization_id
+    ).order_by(Certification.issued_date, Certification.id).yield_per(batch_size)
+
+
+def _archive_name(certification, organization_name):
+    return (f"certificates/Certificate_{organization_name.replace(' ', '_').replace('/', '_')}_"
+            f"{certification.issued_date.strftime('%Y%m%d')}_{certification.id[:8]}.pdf")
+
+
+def _has_file(certification, storage):
+    if certification.pdf_status == PdfStatusEnum.ON_DEMAND:
+        return True
+    return (certification.pdf_status == PdfStatusEnum.READY and bool(certification.certificate_pdf)
+            and storage.exists(certification.certificate_pdf))
+
+
+def _pdf_chunks(certification, storage, render_on_demand):
+    if certification.pdf_status == PdfStatusEnum.ON_DEMAND:
+        yield render_on_demand(certification)[0]
+        return
+    with closing(storage.open(certification.certificate_pdf)) as pdf:
+        while True:
+            chunk = pdf.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+
+
+def stream_certificates_zip(organization, storage, render_on_demand):
+    """
+    Yield a ZIP archive of ``organization``'s certificate PDFs plus ``manifest.json``.
+
+    Nothing is buffered beyond one 64 KiB chunk and the ZIP central directory
+    (about 100 bytes per member): certifications are read from the database in
+    batches, once for the manifest and once for the PDFs. PDFs are already
+    compressed, so they are stored; only the manifest is deflated.
+    Stored PDFs are read from ``storage``; ``render_on_demand(certification)``
+    supplies bytes for on-demand certificates.
+    """
+    return (chunk for chunk in _generate_certificates_zip(organization, storage, render_on_demand) if chunk)
+
+
+def _generate_certificates_zip(organization, storage, render_on_demand):
+    exported_at = datetime.utcnow()
+    buffer = _DrainableBuffer()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        with archive.open(_zip_info('manifest.json', exported_at, zipfile.ZIP_DEFLATED), 'w') as manifest:
+            manifest.write(json.dumps({
+                "organization_id": organization.id,
+                "organization_name": organization.name,
+                "exported_at": exported_at.isoformat() + 'Z',
+            })[:-1].encode() + b', "certificates": [')
+            for index, (certification, audit) in enumerate(_certification_rows(organization.id)):
+                entry = {
+                    "certificate_id": certification.id,
+                    "verification_code": certification.verification_code,
+                    "status": certification.status.value,
+                    "issued_date": certification.issued_date.isoformat(),
+                    "audit_id": audit.id,
+                    "audit_name": audit.name,
+                    "standard": audit.checklist,
+                    "certification_body_id": certification.certification_body_id,
+                    "pdf_sha256": certification.pdf_sha256,
+                    "file": _archive_name(certification, organization.name) if _has_file(certification, storage) else None,
+                }
+                manifest.write((', ' if index else '').encode() + json.dumps(entry).encode())
+                yield buffer.drain()
+            manifest.write(b']}')
+        yield buffer.drain()
+
+        for certification, _ in _certification_rows(organization.id):
+            if not _has_file(certification, storage):
+                continue
+            info = _zip_info(_archive_name(certification, organization.name),
+                             certification.pdf_rendered_at or certification.created_at or exported_at,
+                             zipfile.ZIP_STORED)
+            with archive.open(info, 'w') as member:
+                for chunk in _pdf_chunks(certification, storage, render_on_demand):
+                    member.write(chunk)
+                    yield buffer.drain()
+            yield buffer.drain()
+    yield buffer.drain()
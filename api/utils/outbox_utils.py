@@ -0,0 +1,166 @@
+import copy
+import smtplib
+import socket
+import time
+from collections import deque
+from datetime import datetime, timedelta
+
+from flask import current_app
+from flask_mail import Message
+
+from api.extensions import db, mail
+from api.models.models import EmailOutbox, OutboxStatusEnum
+from api.utils.digest_utils import send_due_digests
+
+# Errors that mean the SMTP session itself is gone, as opposed to a single message being refused.
+CONNECTION_ERRORS = (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, ConnectionError,
+                     socket.timeout, socket.gaierror)
+
+
+def build_message(entry):
+    """Rebuild the Flask-Mail message stored in an outbox row."""
+    return Message(
+        subject=entry.subject,
+        recipients=[address.strip() for address in entry.recipients.split(',') if address.strip()],
+        html=entry.html,
+        body=entry.body,
+        sender=entry.sender or current_app.config['MAIL_DEFAULT_SENDER'],
+    )
+
+
+def _schedule_retry(entry, exc):
+    """Record a failed attempt and push the next one back exponentially."""
+    entry.attempts += 1
+    entry.last_error = str(exc)
+    if entry.attempts >= current_app.config['OUTBOX_MAX_ATTEMPTS']:
+        entry.status = OutboxStatusEnum.FAILED
+        return
+    delay = current_app.config['OUTBOX_RETRY_BACKOFF'] * 2 ** (entry.attempts - 1)
+    entry.next_attempt_at = datetime.utcnow() + timedelta(seconds=delay)
+
+
+def _mark_sent(entry):
+    entry.attempts += 1
+    entry.status = OutboxStatusEnum.SENT
+    entry.sent_at = datetime.utcnow()
+    entry.last_error = None
+
+
+def _reconnect(conn):
+    """Replace a dropped SMTP session on a Flask-Mail connection; with MAIL_SUPPRESS_SEND there is none to open."""
+    if conn.host is not None:
+        try:
+            conn.host.quit()
+        except CONNECTION_ERRORS + (smtplib.SMTPException,):
+            pass
+    conn.host = None if conn.mail.suppress else conn.configure_host()
+    conn.num_emails = 0
+
+
+def send_pooled(conn, message):
+    """
+    Send ``message`` over an open connection, reconnecting once if the server hung up.
+    ``conn`` must come from ``_pooled_connection``: a session Flask-Mail recycles itself
+    can fail after ``sendmail`` has already handed the message over.
+    """
+    try:
+        conn.send(message)
+    except CONNECTION_ERRORS:
+        if conn.host is None:
+            raise
+        _reconnect(conn)
+        conn.send(message)
+
+
+def _pooled_connection():
+    """A Flask-Mail connection that leaves recycling every ``MAIL_MAX_EMAILS`` messages to the caller."""
+    conn = mail.connect()
+    conn.mail = copy.copy(conn.mail)
+    conn.mail.max_emails = None
+    return conn
+
+
+def _deliver_over_connection(entries):
+    """
+    Deliver ``entries`` over one SMTP session, recycled every ``MAIL_MAX_EMAILS`` messages
+    (the batch size per TLS handshake) between sends rather than after one.
+    """
+    max_emails = current_app.config['MAIL_MAX_EMAILS']
+    pending = deque(entries)
+    try:
+        with _pooled_connection() as conn:
+            while pending:
+                entry = pending[0]
+                if max_emails and conn.num_emails >= max_emails:
+                    _reconnect(conn)
+                try:
+                    send_pooled(conn, build_message(entry))
+                except CONNECTION_ERRORS:
+                    raise
+                except Exception as exc:
+                    _schedule_retry(entry, exc)
+                else:
+                    _mark_sent(entry)
+                pending.popleft()
+    except CONNECTION_ERRORS + (smtplib.SMTPException,) as exc:
+        # The server could not be reached (or dropped us twice); whatever is left waits for the next round.
+        for entry in pending:
+            _schedule_retry(entry, exc)
+
+
+def deliver_pending_emails(batch_size=None, pooled=True):
+    """
+    Deliver one batch of due outbox rows and return how many were attempted.
+
+    Rows are claimed with ``FOR UPDATE SKIP LOCKED`` so several workers can drain
+    the outbox concurrently without sending the same message twice. With ``pooled``
+    the batch shares one SMTP connection instead of reconnecting for every message.
+    """
+    batch_size = batch_size or current_app.config['OUTBOX_BATCH_SIZE']
+    entries = EmailOutbox.query.filter(
+        EmailOutbox.status == OutboxStatusEnum.PENDING,
+        EmailOutbox.next_attempt_at <= datetime.utcnow()
+    ).order_by(EmailOutbox.next_attempt_at).limit(batch_size).with_for_update(skip_locked=True).all()
+
+    if pooled and entries:
+        _deliver_over_connection(entries)
+    else:
+        for entry in entries:
+            try:
+                mail.send(build_message(entry))
+            except Exception as exc:
+                _schedule_retry(entry, exc)
+            else:
+                _mark_sent(entry)
+
+    db.session.commit()
+    return len(entries)
+
+
+def run_outbox_worker(poll_interval=None, once=False):
+    """
+    Drain the outbox until interrupted, sleeping ``poll_interval`` seconds when idle.
+    Notification digests that are due are queued every ``DIGEST_CHECK_INTERVAL`` seconds.
+    With ``once`` the worker exits as soon as nothing is due. Must be called inside an
+    application context.
+    """
+    poll_interval = poll_interval or current_app.config['OUTBOX_POLL_INTERVAL']
+    next_digest_check = 0
+    while True:
+        if time.monotonic() >= next_digest_check:
+            try:
+                send_due_digests()
+            except Exception as exc:
+                db.session.rollback()
+                current_app.logger.error(f"Digest sweep failed: {str(exc)}")
+            next_digest_check = time.monotonic() + current_app.config['DIGEST_CHECK_INTERVAL']
+        try:
+            attempted = deliver_pending_emails()
+        except Exception as exc:
+            db.session.rollback()
+            current_app.logger.error(f"Outbox delivery failed: {str(exc)}")
+            attempted = 0
+        if not attempted:
+            if once:
+                return
+            time.sleep(poll_interval)
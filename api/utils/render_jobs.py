@@ -0,0 +1,192 @@
+import hashlib
+import multiprocessing
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from datetime import datetime
+
+from flask import current_app
+
+from api.extensions import db
+from api.models.models import Certification, PdfStatusEnum
+from api.utils.cache import LRUByteCache, DiskByteCache, TieredByteCache
+from api.utils.certification_utils import generate_certificate_pdf, render_certificate_pdf
+from api.utils.email_utils import send_certification_email, certificate_download_url
+from api.utils.storage import get_storage
+
+_executor = None
+_process_pool = None
+_certificate_cache = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor(app):
+    """The process-wide render pool, created on first use with ``CERTIFICATE_RENDER_WORKERS`` threads."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=app.config['CERTIFICATE_RENDER_WORKERS'],
+                                           thread_name_prefix='certificate-render')
+    return _executor
+
+
+def _get_process_pool(app):
+    """
+    The process-wide pool for bulk rendering, with ``CERTIFICATE_RENDER_PROCESSES``
+    workers (one per CPU by default). Workers are spawned rather than forked so
+    they do not inherit the app's database connections or render threads.
+    """
+    global _process_pool
+    with _executor_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(max_workers=app.config['CERTIFICATE_RENDER_PROCESSES'],
+                                                mp_context=multiprocessing.get_context('spawn'))
+    return _process_pool
+
+
+def _get_certificate_cache(app):
+    """Rendered on-demand certificates: a memory LRU, backed by a disk cache when one is configured."""
+    global _certificate_cache
+    with _executor_lock:
+        if _certificate_cache is None:
+            disk = None
+            if app.config['CERTIFICATE_DISK_CACHE_DIR']:
+                disk = DiskByteCache(app.config['CERTIFICATE_DISK_CACHE_DIR'],
+                                     app.config['CERTIFICATE_DISK_CACHE_MAX_BYTES'])
+            _certificate_cache = TieredByteCache(LRUByteCache(app.config['CERTIFICATE_CACHE_MAX_BYTES']), disk)
+    return _certificate_cache
+
+
+def certificate_details(certification):
+    audit = certification.audit
+    return {"organization_id": certification.organization_id, "recipient_name": audit.organization.name,
+            "checklist": audit.checklist, "issued_date": certification.issued_date,
+            "verification_code": certification.verification_code}
+
+
+def issue_on_demand(certification, download_url=None):
+    """Issue without rendering: the PDF is built from the row when first downloaded. The caller commits."""
+    certification.pdf_status = PdfStatusEnum.ON_DEMAND
+    send_certification_email(certification, download_url=download_url)
+
+
+def render_certificate_on_demand(certification):
+    """
+    Return ``(pdf_bytes, sha256)`` for an on-demand certificate, rendering it on a cache miss.
+    The key covers everything printed on the PDF, so a renamed organization gets a fresh render.
+    """
+    details = certificate_details(certification)
+    fingerprint = "|".join([certification.id, details['recipient_name'], ''.join(details['checklist']),
+                            str(details['issued_date']), details['verification_code'] or ''])
+    key = hashlib.sha256(fingerprint.encode()).hexdigest()
+    data = _get_certificate_cache(current_app).get_or_create(key, lambda: render_certificate_pdf(details))
+    return data, hashlib.sha256(data).hexdigest()
+
+
+def _record_render_failure(certification, exc):
+    certification.pdf_status = PdfStatusEnum.FAILED
+    certification.pdf_error = str(exc)
+    current_app.logger.error(f"Rendering certificate {certification.id} failed: {str(exc)}")
+
+
+def _record_render(certification, storage_key, sha256, download_url=None):
+    """Mark ``certification`` ready and queue the email with its download link."""
+    certification.certificate_pdf = storage_key
+    certification.pdf_sha256 = sha256
+    certification.pdf_status = PdfStatusEnum.READY
+    certification.pdf_error = None
+    certification.pdf_rendered_at = datetime.utcnow()
+    send_certification_email(certification, download_url=download_url)
+
+
+def render_certificate(certification, download_url=None):
+    """
+    Render the PDF for ``certification`` and record the outcome on the row.
+    On success the organization is emailed the download link. The caller commits.
+    """
+    try:
+        storage_key, sha256 = generate_certificate_pdf(certification.id, certificate_details(certification),
+                                                       get_storage())
+    except Exception as exc:
+        _record_render_failure(certification, exc)
+        return False
+    _record_render(certification, storage_key, sha256, download_url)
+    return True
+
+
+def render_certificates_in_pool(certifications, download_urls):
+    """
+    Render many certificates in parallel on the process pool and record each
+    outcome like ``render_certificate``. The caller commits. Returns one bool per row.
+    """
+    app = current_app._get_current_object()
+    storage = get_storage(app)
+    pool = _get_process_pool(app)
+    futures = [pool.submit(generate_certificate_pdf, certification.id, certificate_details(certification),
+                           storage) for certification in certifications]
+    rendered = []
+    for certification, download_url, future in zip(certifications, download_urls, futures):
+        try:
+            storage_key, sha256 = future.result()
+        except Exception as exc:
+            _record_render_failure(certification, exc)
+            rendered.append(False)
+        else:
+            _record_render(certification, storage_key, sha256, download_url)
+            rendered.append(True)
+    return rendered
+
+
+def _run_render_job(app, certification_id, download_url):
+    with app.app_context():
+        try:
+            certification = db.session.get(Certification, certification_id)
+            if certification is None or certification.pdf_status == PdfStatusEnum.READY:
+                return
+            render_certificate(certification, download_url)
+            db.session.commit()
+        except Exception as exc:
+            db.session.rollback()
+            app.logger.error(f"Certificate render job {certification_id} failed: {str(exc)}")
+
+
+def enqueue_certificate_render(certification, download_url=None):
+    """
+    Schedule the PDF render for a committed ``certification``.
+
+    With ``CERTIFICATE_RENDER_MODE = 'async'`` (the default) the render runs on the
+    background pool and the returned future can be ignored; clients poll the status
+    endpoint. ``'sync'`` renders inline and commits before returning, and
+    ``'on_demand'`` stores nothing until the first download.
+    """
+    app = current_app._get_current_object()
+    if app.config['CERTIFICATE_RENDER_MODE'] == 'on_demand':
+        issue_on_demand(certification, download_url)
+        db.session.commit()
+        return None
+    if app.config['CERTIFICATE_RENDER_MODE'] == 'sync':
+        render_certificate(certification, download_url)
+        db.session.commit()
+        return None
+    return _get_executor(app).submit(_run_render_job, app, certification.id, download_url)
+
+
+def render_pending_certificates(include_failed=False):
+    """
+    Render every certification still waiting for its PDF, e.g. after a restart dropped
+    queued jobs. Runs inline and returns ``(rendered, failed)`` counts; a row that fails
+    is marked failed and the rest are still rendered.
+    """
+    statuses = [PdfStatusEnum.PENDING] + ([PdfStatusEnum.FAILED] if include_failed else [])
+    certifications = Certification.query.filter(Certification.pdf_status.in_(statuses)).all()
+    rendered = 0
+    for certification in certifications:
+        try:
+            success = render_certificate(certification, certificate_download_url(certification.id))
+            db.session.commit()
+        except Exception as exc:
+            db.session.rollback()
+            _record_render_failure(certification, exc)
+            db.session.commit()
+            success = False
+        rendered += success
+    return rendered, len(certifications) - rendered
@@ -0,0 +1,65 @@
+import threading
+from datetime import datetime
+
+from flask import current_app
+from sqlalchemy import func
+
+from api.extensions import db
+from api.models.models import Certification, CertificationRevocation, CertificationStatusEnum
+from api.utils.cache import TTLCache
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def _get_cache(app):
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = TTLCache(app.config['REVOCATION_LIST_MAX_AGE'], 256)
+    return _cache
+
+
+def revoke_certification(certification, user, reason=None):
+    """Mark ``certification`` revoked and append it to the revocation list. The caller commits."""
+    certification.status = CertificationStatusEnum.REVOKED
+    certification.updated_at = datetime.utcnow()
+    revocation = CertificationRevocation(certification_id=certification.id, revoked_by_id=user.id, reason=reason)
+    db.session.add(revocation)
+    return revocation
+
+
+def current_revocation_version():
+    return db.session.query(func.max(CertificationRevocation.version)).scalar() or 0
+
+
+def _build_revocation_list(version, since):
+    query = db.session.query(Certification.verification_code).join(
+        CertificationRevocation, CertificationRevocation.certification_id == Certification.id).filter(
+        CertificationRevocation.version <= version, Certification.verification_code.isnot(None))
+    if since:
+        query = query.filter(CertificationRevocation.version > since)
+    return {
+        "version": version,
+        "since": since,
+        "full": not since,
+        "revoked": sorted(code for code, in query),
+    }
+
+
+def revocation_list(since=0):
+    """
+    Sorted verification codes of certifications revoked after version ``since`` (all of
+    them when 0), stamped with the current version for the verifier's next ``since``.
+    Certificate ids are never published: they are the keys of the download links.
+
+    A list is immutable once built for a (version, since) pair, so it is cached and
+    each request costs one ``max(version)`` lookup. A ``since`` ahead of the server
+    (e.g. a verifier synced against another database) gets the full list.
+    Concurrent revocations can commit out of version order, so verifiers should ask
+    for a few versions before their last one; codes are safe to apply twice.
+    """
+    version = current_revocation_version()
+    if since > version:
+        since = 0
+    return _get_cache(current_app).get_or_create((version, since), lambda: _build_revocation_list(version, since))
@@ -0,0 +1,206 @@
+import heapq
+import math
+import re
+from array import array
+from collections import Counter
+from operator import itemgetter
+
+from api.models.mongodb_model import FILTER_FIELDS
+from api.utils.standards_utils import VersionedIndex, ACTIVE_STANDARDS
+
+TOKEN = re.compile(r'[0-9a-z]+')
+# Indexed fields and how much a match in each counts towards a term's frequency
+FIELD_WEIGHTS = {'Iso': 3, 'Category': 1, 'SubCategory': 1, 'description': 2, 'abstract': 1}
+INDEXED_FIELDS = {field: 1 for field in ('Iso', *FIELD_WEIGHTS, *FILTER_FIELDS)}
+MAX_TF = 0xFFFF
+ID_BATCH = 1000
+
+
+def _text(value):
+    if isinstance(value, (list, tuple)):
+        return ' '.join(_text(item) for item in value)
+    return str(value) if value else ''
+
+
+def tokenize(text):
+    return TOKEN.findall(_text(text).casefold())
+
+
+class BM25Index:
+    """
+    Inverted index over the active standards with BM25 ranking.
+
+    Each term's postings are two parallel arrays (document ordinals and weighted
+    term frequencies), appended to in ordinal order. ``refresh`` applies a
+    catalogue change incrementally: standards that left the active set are
+    tombstoned, new ones are appended. Readers may briefly see a half-applied
+    refresh, which only affects how the changed standards rank.
+    """
+    k1 = 1.2
+    b = 0.75
+
+    def __init__(self):
+        self.postings = {}
+        self.ids = []
+        self.isos = []
+        self.filters = []
+        self.lengths = array('I')
+        self.norms = array('d')
+        self.impacts = {}
+        self.alive = bytearray()
+        self.ordinals = {}
+        self.live_count = 0
+        self.live_length = 0
+        self.dead_count = 0
+
+    @classmethod
+    def from_documents(cls, standards):
+        index = cls()
+        for standard in standards:
+            index.add(standard)
+        index._update_norms()
+        return index
+
+    @classmethod
+    def from_mongo(cls, mongo):
+        return cls.from_documents(mongo.iter_standards(ACTIVE_STANDARDS, INDEXED_FIELDS))
+
+    def add(self, standard):
+        counts = Counter()
+        for field, weight in FIELD_WEIGHTS.items():
+            for token in tokenize(standard.get(field)):
+                counts[token] += weight
+        length = sum(counts.values())
+
+        ordinal = len(self.ids)
+        self.ids.append(standard['_id'])
+        self.isos.append(standard.get('Iso') or '')
+        self.filters.append(tuple(standard.get(field) for field in FILTER_FIELDS))
+        self.lengths.append(length)
+        self.norms.append(self._norm(length))
+        self.alive.append(1)
+        self.ordinals[standard['_id']] = ordinal
+        for term, tf in counts.items():
+            postings = self.postings.get(term)
+            if postings is None:
+                postings = self.postings[term] = (array('I'), array('H'))
+            postings[0].append(ordinal)
+            postings[1].append(min(tf, MAX_TF))
+        self.live_count += 1
+        self.live_length += length
+
+    def remove(self, standard_id):
+        ordinal = self.ordinals.pop(standard_id, None)
+        if ordinal is None:
+            return
+        self.alive[ordinal] = 0
+        self.live_count -= 1
+        self.live_length -= self.lengths[ordinal]
+        self.dead_count += 1
+
+    def refresh(self, mongo):
+        """
+        Catch up with the catalogue: one ``_id``-only scan of the active set, then
+        only new standards are read and tokenized. Standards edited in place
+        (other than by retirement) keep their old terms until the next full build.
+        """
+        active = {standard['_id'] for standard in mongo.iter_standards(ACTIVE_STANDARDS, {'_id': 1})}
+        for standard_id in self.ordinals.keys() - active:
+            self.remove(standard_id)
+        added = list(active - self.ordinals.keys())
+        for start in range(0, len(added), ID_BATCH):
+            for standard in mongo.iter_standards({'_id': {'$in': added[start:start + ID_BATCH]}}, INDEXED_FIELDS):
+                self.add(standard)
+        self._update_norms()
+
+    @property
+    def needs_compaction(self):
+        """Tombstones waste memory and scoring time; past a quarter of the index, rebuild."""
+        return self.dead_count > self.live_count // 4
+
+    def _norm(self, length):
+        average = self.live_length / self.live_count if self.live_count else 1
+        return self.k1 * (1 - self.b + self.b * length / (average or 1))
+
+    def _update_norms(self):
+        self.norms = array('d', (self._norm(length) for length in self.lengths))
+        self.impacts = {}
+
+    def _impacts(self, term, ordinals, tfs):
+        """
+        BM25 term-frequency weights of a term's postings, computed on first use and
+        kept until document lengths change; float32 halves their footprint.
+        """
+        impacts = self.impacts.get(term)
+        if impacts is None or len(impacts) != len(ordinals):
+            k1, norms = self.k1, self.norms
+            impacts = self.impacts[term] = array('f', (tf * (k1 + 1) / (tf + norms[ordinal])
+                                                       for ordinal, tf in zip(ordinals, tfs)))
+        return impacts
+
+    def search(self, query, filters=None, limit=10, skip=0):
+        """
+        ``(ranked, total)``: ``(standard _id, score)`` pairs for ranks ``skip`` to
+        ``skip + limit`` and the number of matches. ``filters`` maps FILTER_FIELDS
+        names to required values. Ties rank by Iso, then _id.
+        """
+        alive = self.alive
+        terms = [(term, self.postings[term]) for term in set(tokenize(query)) if term in self.postings]
+        # The longest postings list seeds the scores in one C-level pass; the rest are added to it
+        terms.sort(key=lambda item: len(item[1][0]), reverse=True)
+        scores = {}
+        for term, (ordinals, tfs) in terms:
+            df = sum(alive[ordinal] for ordinal in ordinals) if self.dead_count else len(ordinals)
+            if not df:
+                continue
+            idf = math.log(1 + (self.live_count - df + 0.5) / (df + 0.5))
+            weights = map(idf.__mul__, self._impacts(term, ordinals, tfs))
+            if not scores:
+                scores = dict(zip(ordinals, weights))
+                continue
+            for ordinal, weight in zip(ordinals, weights):
+                scores[ordinal] = scores.get(ordinal, 0.0) + weight
+        if self.dead_count:
+            scores = {ordinal: score for ordinal, score in scores.items() if alive[ordinal]}
+
+        if filters:
+            wanted = [(FILTER_FIELDS.index(field), value) for field, value in filters.items()]
+            scores = {ordinal: score for ordinal, score in scores.items()
+                      if all(self.filters[ordinal][i] == value for i, value in wanted)}
+        return self._rank(scores, skip + limit)[skip:], len(scores)
+
+    def _rank(self, scores, count):
+        """The ``count`` best ``(standard _id, score)`` pairs; every tie at the cut-off is kept for ordering."""
+        top = heapq.nlargest(count, scores.items(), key=itemgetter(1))
+        if len(top) == count:
+            cutoff = top[-1][1]
+            top = [item for item in scores.items() if item[1] >= cutoff]
+        top.sort(key=lambda item: (-item[1], self.isos[item[0]], str(self.ids[item[0]])))
+        return [(self.ids[ordinal], score) for ordinal, score in top[:count]]
+
+    def __len__(self):
+        return self.live_count
+
+
+def _refresh_search_index(index, mongo):
+    index.refresh(mongo)
+    return BM25Index.from_mongo(mongo) if index.needs_compaction else index
+
+
+_search_index = VersionedIndex(BM25Index.from_mongo, _refresh_search_index)
+
+
+def get_search_index(mongo):
+    """The process-wide BM25Index, refreshed incrementally when the catalogue changes."""
+    return _search_index.get(mongo)
+
+
+def search_standards(mongo, keyword, filters=None, projection=None, skip=0, limit=10):
+    """
+    ``(page, total)`` for a keyword search ranked by the in-process BM25 index.
+    The page's documents are then read by ``_id`` in one round trip.
+    """
+    ranked, total = get_search_index(mongo).search(keyword, filters=filters, limit=limit, skip=skip)
+    documents = {document['_id']: document
+                 for document in mongo.fetch_standards_by_ids([standard_id for standard_id, _ in ranked], projection)}
+    return [dict(documents[standard_id], score=score) for standard_id, score in ranked if standard_id in documents], total
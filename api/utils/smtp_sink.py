@@ -0,0 +1,165 @@
+import argparse
+import socketserver
+import threading
+import time
+from dataclasses import dataclass, field
+
+
+def _address(arg):
+    """Extract the address from ``FROM:<a@b> SIZE=1`` / ``TO:<a@b>``."""
+    value = arg.partition(':')[2].strip()
+    return value.split()[0].strip('<>') if value else ''
+
+
+@dataclass
+class SinkMessage:
+    mail_from: str
+    rcpt_tos: list
+    data: bytes
+    received_at: float = field(default_factory=time.time)
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    def reply(self, line):
+        self.wfile.write(line.encode('ascii') + b'\r\n')
+
+    def handle(self):
+        sink = self.server.sink
+        with sink.lock:
+            sink.connections += 1
+        if sink.connect_delay:
+            time.sleep(sink.connect_delay)  # Stands in for the TCP + TLS + AUTH cost of a real provider
+        self.reply('220 localhost SMTP sink ready')
+
+        mail_from, rcpt_tos = None, []
+        while True:
+            raw = self.rfile.readline()
+            if not raw:
+                return
+            line = raw.decode('utf-8', 'replace').rstrip('\r\n')
+            verb, _, arg = line.partition(' ')
+            verb = verb.upper()
+
+            if verb == 'EHLO':
+                self.wfile.write(b'250-localhost\r\n250-8BITMIME\r\n250-SMTPUTF8\r\n250 AUTH PLAIN\r\n')
+            elif verb == 'HELO':
+                self.reply('250 localhost')
+            elif verb == 'AUTH':
+                if arg.upper() == 'PLAIN':
+                    self.reply('334 ')
+                    self.rfile.readline()
+                self.reply('235 Authentication successful')
+            elif verb == 'STARTTLS':
+                self.reply('454 TLS not available')
+            elif verb == 'MAIL':
+                mail_from, rcpt_tos = _address(arg), []
+                self.reply('250 OK')
+            elif verb == 'RCPT':
+                rcpt_tos.append(_address(arg))
+                self.reply('250 OK')
+            elif verb == 'DATA':
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+                chunks = []
+                while True:
+                    data_line = self.rfile.readline()
+                    if not data_line or data_line in (b'.\r\n', b'.\n'):
+                        break
+                    chunks.append(data_line[1:] if data_line.startswith(b'.') else data_line)
+                sink.record(SinkMessage(mail_from, rcpt_tos, b''.join(chunks)))
+                mail_from, rcpt_tos = None, []
+                self.reply('250 OK: queued')
+            elif verb == 'RSET':
+                mail_from, rcpt_tos = None, []
+                self.reply('250 OK')
+            elif verb == 'NOOP':
+                self.reply('250 OK')
+            elif verb == 'QUIT':
+                self.reply('221 Bye')
+                return
+            else:
+                self.reply('502 Command not implemented')
+
+
+class _ThreadingSMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class SMTPSink:
+    """
+    Local SMTP server for development, offline CI and the email benchmarks.
+
+    Runs on ``host:port`` (port 0 picks a free one), keeps every accepted message in
+    ``messages`` and counts sessions in ``connections``; ``connect_delay`` seconds are
+    spent on each new session to model a real provider's handshake cost. Use it
+    in-process as a context manager, or as a subprocess with
+    ``python -m api.utils.smtp_sink --port 1025``.
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, connect_delay=0.0, on_message=None):
+        self.host = host
+        self.port = port
+        self.connect_delay = connect_delay
+        self.on_message = on_message
+        self.messages = []
+        self.connections = 0
+        self.lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    def record(self, message):
+        with self.lock:
+            self.messages.append(message)
+        if self.on_message:
+            self.on_message(message)
+
+    def reset(self):
+        with self.lock:
+            self.messages.clear()
+            self.connections = 0
+
+    def start(self):
+        self._server = _ThreadingSMTPServer((self.host, self.port), _SMTPHandler)
+        self._server.sink = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name='smtp-sink', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run a local SMTP sink that logs every message it receives.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=1025)
+    parser.add_argument('--connect-delay', type=float, default=0.0,
+                        help='Seconds to stall each new connection, to model TLS/auth handshakes.')
+    args = parser.parse_args()
+
+    def log(message):
+        subject = next((line for line in message.data.decode('utf-8', 'replace').splitlines()
+                        if line.lower().startswith('subject:')), 'Subject: (none)')
+        print(f"{message.mail_from} -> {', '.join(message.rcpt_tos)} | {subject[8:].strip()}", flush=True)
+
+    sink = SMTPSink(args.host, args.port, args.connect_delay, on_message=log).start()
+    print(f"SMTP sink listening on {sink.host}:{sink.port}", flush=True)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        sink.stop()
+
+
+if __name__ == '__main__':
+    main()
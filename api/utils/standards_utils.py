@@ -0,0 +1,158 @@
+import hashlib
+import json
+import threading
+import time
+
+from flask import current_app
+
+from api.utils.cache import TTLCache
+
+# Active standards, as the list endpoint filters them
+ACTIVE_STANDARDS = {'is_active': {'$ne': False}}
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def _get_cache(app):
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = TTLCache(app.config['STANDARDS_CACHE_TTL'], app.config['STANDARDS_CACHE_MAX_ENTRIES'])
+    return _cache
+
+
+class VersionedIndex:
+    """
+    A process-wide in-memory index kept in step with the catalogue version stamp.
+    ``build(mongo)`` creates it; ``refresh(index, mongo)``, when given, brings it
+    up to date after a catalogue change and returns it (or a replacement),
+    otherwise the index is rebuilt. The stamp is checked at most every
+    STANDARDS_VERSION_CHECK_INTERVAL seconds, and while one request refreshes,
+    others keep answering from the current index.
+    """
+
+    def __init__(self, build, refresh=None):
+        self._build = build
+        self._refresh = refresh
+        self._index = None
+        self._version = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _stale(self):
+        return time.monotonic() - self._checked_at >= current_app.config['STANDARDS_VERSION_CHECK_INTERVAL']
+
+    def get(self, mongo):
+        if self._index is not None and not self._stale():
+            return self._index
+        if not self._lock.acquire(blocking=self._index is None):
+            return self._index
+        try:
+            if self._index is None or self._stale():
+                version = mongo.catalogue_version()
+                if self._index is None:
+                    self._index = self._build(mongo)
+                elif version != self._version:
+                    self._index = self._refresh(self._index, mongo) if self._refresh else self._build(mongo)
+                self._version = version
+                self._checked_at = time.monotonic()
+            return self._index
+        finally:
+            self._lock.release()
+
+
+def query_key(query):
+    """Canonical form of a Mongo filter, so equivalent queries share cache entries."""
+    return json.dumps(query, sort_keys=True, default=str)
+
+
+def is_unfiltered(query):
+    """True when ``query`` is just the default filter ``build_query`` always adds."""
+    return set(query) <= {'is_active'}
+
+
+def cached_standards_query(mongo, query, projection=None, skip=0, limit=10, after=None, count='exact'):
+    """``(page, total, exact)`` for ``query``, cached until the catalogue version changes."""
+    cache = _get_cache(current_app)
+    version = mongo.catalogue_version()
+    key = query_key(query)
+    page_key = ('page', version, key, query_key(projection), skip, limit, query_key(after))
+
+    def fetch_page():
+        return mongo.fetch_standards(query=query, projection=projection, skip=skip, limit=limit, after=after)
+
+    if count == 'none':
+        return cache.get_or_create(page_key, fetch_page), None, False
+    if is_unfiltered(query):
+        page = cache.get_or_create(page_key, fetch_page)
+        if count == 'estimate':
+            # Collection metadata: no scan, but retired standards are included
+            return page, cache.get_or_create(('estimate', version), mongo.estimate_standards), False
+        return page, cache.get_or_create(('count', version, key), lambda: mongo.count_standards(query)), True
+    if count == 'estimate':
+        cap = current_app.config['STANDARDS_COUNT_ESTIMATE_CAP']
+        page = cache.get_or_create(page_key, fetch_page)
+        total = cache.get(('count', version, key))
+        if total is None:
+            total = cache.get_or_create(('capped', version, key, cap), lambda: mongo.count_standards(query, limit=cap))
+            return page, total, total < cap
+        return page, total, True
+
+    page, total = cache.get(page_key), cache.get(('count', version, key))
+    if page is None and total is None:
+        page, total = mongo.fetch_standards_with_total(query, projection, skip=skip, limit=limit, after=after)
+        cache.set(page_key, page)
+        cache.set(('count', version, key), total)
+    elif page is None:
+        page = cache.get_or_create(page_key, fetch_page)
+    elif total is None:
+        total = cache.get_or_create(('count', version, key), lambda: mongo.count_standards(query))
+    return page, total, True
+
+
+def cached_standard_detail(mongo, standard_iso, dump):
+    """
+    ``(document, etag)`` for one standard, or None: ``dump`` serializes the stored
+    document, and the ETag hashes that output, so it only changes when the
+    standard itself does. Cached per catalogue version like list pages.
+    """
+    def load():
+        standard = mongo.find_standard_by_iso(standard_iso, ACTIVE_STANDARDS)
+        if standard is None:
+            return None
+        document = dump(standard)
+        return document, hashlib.sha256(query_key(document).encode()).hexdigest()[:32]
+
+    return _get_cache(current_app).get_or_create(('standard', mongo.catalogue_version(), standard_iso), load)
+
+
+def cached_standard_facets(mongo, query, limit):
+    """
+    Facet counts for ``query``, cached like pages (per query and catalogue version)
+    unless STANDARDS_CACHE_FACETS is off.
+    """
+    if not current_app.config['STANDARDS_CACHE_FACETS']:
+        return mongo.facet_standards(query, limit=limit)
+    key = ('facets', mongo.catalogue_version(), query_key(query), limit)
+    return _get_cache(current_app).get_or_create(key, lambda: mongo.facet_standards(query, limit=limit))
+
+
+def plan_stages(plan):
+    """Stage names of an explain() plan tree, root first."""
+    stages = [plan.get('stage')]
+    for child in [plan.get('inputStage'), plan.get('queryPlan'), *plan.get('inputStages', [])]:
+        if child:
+            stages += plan_stages(child)
+    return [stage for stage in stages if stage]
+
+
+def explain_standard_filters(mongo, fields):
+    """
+    ``(label, stages)`` for the page query of each filter in ``fields``, plus the
+    unfiltered and keyword queries. A COLLSCAN stage means no index was used.
+    """
+    baseline = ACTIVE_STANDARDS
+    queries = [('unfiltered', baseline), ('keyword', dict(baseline, **{'$text': {'$search': 'probe'}}))]
+    queries += [(field, dict(baseline, **{field: 'probe'})) for field in fields]
+    return [(label, plan_stages(mongo.explain_standards(query))) for label, query in queries]
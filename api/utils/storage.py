@@ -0,0 +1,190 @@
+import io
+import os
+import shutil
+import tempfile
+import threading
+import unicodedata
+from abc import ABC, abstractmethod
+from urllib.parse import quote
+
+from flask import current_app
+from werkzeug.http import dump_options_header
+
+CHUNK_SIZE = 64 * 1024
+
+_storage = None
+_storage_lock = threading.Lock()
+
+
+class CertificateStorage(ABC):
+    """
+    Where certificate PDFs live. ``Certification.certificate_pdf`` holds a storage
+    key (``ab/cd/<certificate id>/<sha256>.pdf``). Rows written before storage
+    keys existed hold an absolute local path instead. Every backend still
+    reads those paths from the local disk.
+    """
+
+    def exists(self, key):
+        if os.path.isabs(key):
+            return os.path.exists(key)
+        return self._exists(key)
+
+    def open(self, key):
+        """A binary file-like object for streaming the stored bytes; close it when done."""
+        if os.path.isabs(key):
+            return open(key, 'rb')
+        return self._open(key)
+
+    def local_path(self, key):
+        """Filesystem path of ``key`` if it is stored on this machine, else None."""
+        return key if os.path.isabs(key) else None
+
+    @abstractmethod
+    def save(self, key, data):
+        """Store ``data`` (bytes or a binary file object) under ``key``."""
+
+    @abstractmethod
+    def _exists(self, key):
+        pass
+
+    @abstractmethod
+    def _open(self, key):
+        pass
+
+
+class LocalStorage(CertificateStorage):
+    """Files under ``root``; keys are sharded two levels deep so no directory grows huge."""
+
+    def __init__(self, root):
+        self.root = root
+
+    def path(self, key):
+        return os.path.join(self.root, *key.split('/'))
+
+    def local_path(self, key):
+        return key if os.path.isabs(key) else self.path(key)
+
+    def _exists(self, key):
+        return os.path.exists(self.path(key))
+
+    def _open(self, key):
+        return open(self.path(key), 'rb')
+
+    def save(self, key, data):
+        """Write ``data`` (bytes or a binary file object) via a temp file renamed into place."""
+        file_path = self.path(key)
+        directory = os.path.dirname(file_path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-', suffix='.pdf')
+        try:
+            with os.fdopen(fd, 'wb') as tmp:
+                if isinstance(data, (bytes, bytearray)):
+                    tmp.write(data)
+                else:
+                    shutil.copyfileobj(data, tmp, CHUNK_SIZE)
+                tmp.flush()
+                os.fsync(tmp.fileno())
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+class S3Storage(CertificateStorage):
+    """
+    Objects in an S3-compatible bucket. ``endpoint_url`` points at MinIO, moto
+    or another stand-in. boto3 is only imported when this backend is used.
+    """
+
+    def __init__(self, bucket, prefix='', endpoint_url=None, region_name=None):
+        self.bucket = bucket
+        self.prefix = prefix
+        self.endpoint_url = endpoint_url
+        self.region_name = region_name
+        self._client = None
+
+    def __getstate__(self):
+        # Render worker processes build their own client.
+        state = self.__dict__.copy()
+        state['_client'] = None
+        return state
+
+    @property
+    def client(self):
+        if self._client is None:
+            try:
+                import boto3
+            except ImportError as exc:
+                raise RuntimeError("CERTIFICATE_STORAGE_BACKEND='s3' requires the boto3 package") from exc
+            self._client = boto3.client('s3', endpoint_url=self.endpoint_url, region_name=self.region_name)
+        return self._client
+
+    def _object_key(self, key):
+        return f"{self.prefix}{key}"
+
+    def _exists(self, key):
+        from botocore.exceptions import ClientError
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self._object_key(key))
+        except ClientError as exc:
+            if exc.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                return False
+            raise
+        return True
+
+    def _open(self, key):
+        return self.client.get_object(Bucket=self.bucket, Key=self._object_key(key))['Body']
+
+    def save(self, key, data):
+        """Upload ``data`` (bytes or a binary file object); large bodies go up in multipart chunks."""
+        fileobj = io.BytesIO(data) if isinstance(data, (bytes, bytearray)) else data
+        self.client.upload_fileobj(fileobj, self.bucket, self._object_key(key),
+                                   ExtraArgs={'ContentType': 'application/pdf'})
+
+    def download_url(self, key, download_name, expires_in):
+        """A presigned GET URL, so the object store serves the bytes and range requests."""
+        return self.client.generate_presigned_url('get_object', ExpiresIn=expires_in, Params={
+            'Bucket': self.bucket,
+            'Key': self._object_key(key),
+            'ResponseContentType': 'application/pdf',
+            'ResponseContentDisposition': attachment_disposition(download_name),
+        })
+
+
+def attachment_disposition(download_name):
+    """``Content-Disposition`` for downloading as ``download_name``, quoted and encoded like ``send_file``."""
+    try:
+        download_name.encode('ascii')
+        disposition = {'filename': download_name}
+    except UnicodeEncodeError:
+        # An ASCII filename plus the RFC 5987 UTF-8 form, for clients that understand it
+        disposition = {'filename': unicodedata.normalize('NFKD', download_name).encode('ascii', 'ignore').decode(),
+                       'filename*': f"UTF-8''{quote(download_name, safe='')}"}
+    return dump_options_header('attachment', disposition)
+
+
+def certificate_storage_key(certificate_id, sha256):
+    """``ab/cd/<certificate id>/<sha256>.pdf``: sharded on the (random) certificate id."""
+    return f"{certificate_id[:2]}/{certificate_id[2:4]}/{certificate_id}/{sha256}.pdf"
+
+
+def create_storage(config):
+    backend = config['CERTIFICATE_STORAGE_BACKEND']
+    if backend == 'local':
+        return LocalStorage(config['CERTIFICATE_STORAGE_ROOT'])
+    if backend == 's3':
+        return S3Storage(config['CERTIFICATE_S3_BUCKET'], config['CERTIFICATE_S3_PREFIX'],
+                         endpoint_url=config['CERTIFICATE_S3_ENDPOINT_URL'] or None,
+                         region_name=config['CERTIFICATE_S3_REGION'] or None)
+    raise ValueError(f"Unknown CERTIFICATE_STORAGE_BACKEND {backend!r}")
+
+
+def get_storage(app=None):
+    """The process-wide storage backend configured for ``app`` (default: the current app)."""
+    global _storage
+    app = app or current_app
+    with _storage_lock:
+        if _storage is None:
+            _storage = create_storage(app.config)
+    return _storage
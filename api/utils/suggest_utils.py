@@ -0,0 +1,72 @@
+import re
+from bisect import bisect_left
+
+from api.utils.standards_utils import VersionedIndex, ACTIVE_STANDARDS
+
+
+def normalize(text):
+    """Lower-cased words separated by single spaces: "ISO/IEC 27001:2022" -> "iso iec 27001 2022"."""
+    return re.sub(r'[^0-9a-z]+', ' ', (text or '').casefold()).strip()
+
+
+def _word_suffixes(text, max_length):
+    """The text from each word onwards, so a prefix can match mid-title: "27001 2022" for "27001"."""
+    text = normalize(text)
+    suffixes, start = set(), 0
+    for word in text.split(' ') if text else ():
+        suffixes.add(text[start:start + max_length])
+        start += len(word) + 1
+    return suffixes
+
+
+class PrefixIndex:
+    """
+    Sorted word-suffix keys of each standard's Iso and description. A lookup is a
+    binary search plus a scan over the matching run, so it never touches Mongo.
+    Iso matches rank ahead of description matches; each group is alphabetical.
+    """
+
+    def __init__(self, standards, max_key_length=48):
+        self.max_key_length = max_key_length
+        self.entries = []
+        iso_keys, text_keys = [], []
+        for standard in standards:
+            ordinal = len(self.entries)
+            self.entries.append({'Iso': standard.get('Iso'), 'description': standard.get('description')})
+            iso_keys += ((key, ordinal) for key in _word_suffixes(standard.get('Iso'), max_length=max_key_length))
+            text_keys += ((key, ordinal) for key in _word_suffixes(standard.get('description'), max_length=max_key_length))
+        self._groups = []
+        for keys in (iso_keys, text_keys):
+            keys.sort()
+            self._groups.append(([key for key, _ in keys], [ordinal for _, ordinal in keys]))
+
+    def search(self, prefix, limit=10):
+        prefix = normalize(prefix)[:self.max_key_length]
+        if not prefix:
+            return []
+        found = {}
+        for keys, ordinals in self._groups:
+            i = bisect_left(keys, prefix)
+            while i < len(keys) and keys[i].startswith(prefix):
+                found.setdefault(ordinals[i], None)
+                if len(found) == limit:
+                    break
+                i += 1
+            if len(found) == limit:
+                break
+        return [self.entries[ordinal] for ordinal in found]
+
+    def __len__(self):
+        return len(self.entries)
+
+
+def _build_suggest_index(mongo):
+    return PrefixIndex(mongo.iter_standards(ACTIVE_STANDARDS, {'Iso': 1, 'description': 1}))
+
+
+_suggest_index = VersionedIndex(_build_suggest_index)
+
+
+def get_suggest_index(mongo):
+    """The process-wide PrefixIndex, rebuilt from Mongo when the catalogue changes."""
+    return _suggest_index.get(mongo)
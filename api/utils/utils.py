@@ -4,8 +4,8 @@ from flask import current_app, abort
 from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity, get_jwt
 from flask_mail import Message
 from itsdangerous import URLSafeTimedSerializer
-from api.extensions import mail
 from api.models.models import User
+from api.utils.email_utils import queue_email
 
 
 def send_email(to, subject, template):
@@ -15,7 +15,7 @@ def send_email(to, subject, template):
         html=template,
         sender=current_app.config['MAIL_USERNAME']
     )
-    mail.send(msg)
+    queue_email(msg)
 
     
 def roles_required(required_roles):
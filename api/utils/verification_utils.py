@@ -0,0 +1,78 @@
+import re
+import threading
+
+from flask import current_app
+
+from api.extensions import db
+from api.models.models import Certification, Organization, CertificationBody, Audit, CertificationStatusEnum
+from api.utils.cache import TTLCache
+
+UUID_PATTERN = re.compile(r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$')
+# Characters people misread on paper, mapped the way Crockford base32 decodes them.
+CODE_ALIASES = str.maketrans({'O': '0', 'I': '1', 'L': '1'})
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def _get_cache(app):
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = TTLCache(app.config['VERIFY_CACHE_TTL'], app.config['VERIFY_CACHE_MAX_ENTRIES'])
+    return _cache
+
+
+def normalize_identifier(identifier):
+    """
+    Canonical cache/lookup key: certificate ids are lower-cased, verification codes
+    are upper-cased, stripped of separators and regrouped as ``XXXX-XXXX-XXXX``.
+    """
+    identifier = identifier.strip()
+    if UUID_PATTERN.match(identifier):
+        return identifier.lower()
+    code = re.sub(r'[^0-9A-Za-z]', '', identifier).upper().translate(CODE_ALIASES)
+    return '-'.join(code[i:i + 4] for i in range(0, len(code), 4))
+
+
+def _load_verification(key):
+    column = Certification.id if UUID_PATTERN.match(key) else Certification.verification_code
+    row = db.session.query(
+        Certification.verification_code, Certification.status, Certification.issued_date,
+        Organization.name, CertificationBody.name, Audit.checklist
+    ).join(Organization, Organization.id == Certification.organization_id) \
+        .join(CertificationBody, CertificationBody.id == Certification.certification_body_id) \
+        .join(Audit, Audit.id == Certification.audit_id) \
+        .filter(column == key).first()
+    if row is None:
+        return None
+    code, status, issued_date, organization_name, certification_body_name, checklist = row
+    return {
+        "verification_code": code,
+        "valid": status == CertificationStatusEnum.ISSUED,
+        "status": status.value,
+        "issued_date": issued_date.isoformat(),
+        "organization_name": organization_name,
+        "certification_body_name": certification_body_name,
+        "standard": checklist,
+    }
+
+
+def verify_certificate(identifier):
+    """
+    Public verification payload for a certificate id or printed verification code,
+    or None when nothing matches. Answers (including misses) are cached for
+    ``VERIFY_CACHE_TTL`` seconds, so repeated checks never reach the database.
+    """
+    key = normalize_identifier(identifier)
+    if not UUID_PATTERN.match(key) and len(key) != 14:
+        return None  # Neither an id nor a well-formed code; not worth a query or a cache slot
+    return _get_cache(current_app).get_or_create(key, lambda: _load_verification(key))
+
+
+def invalidate_verification(certification):
+    """Drop cached answers for ``certification`` after its status changes."""
+    cache = _get_cache(current_app)
+    cache.delete(certification.id)
+    if certification.verification_code:
+        cache.delete(certification.verification_code)
@@ -0,0 +1,53 @@
+"""
+Certificate PDF rendering micro-benchmark.
+
+Renders ``--count`` certificates and reports certificates per second and the
+average file size.
+
+    python benchmarks/certificate_render.py --count 2000
+"""
+import argparse
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from api.utils.certification_utils import render_certificate_pdf  # noqa: E402
+
+STANDARDS = ('ISO 9001', 'ISO 14001', 'ISO/IEC 27001', 'ISO 45001, ISO 50001')
+
+
+def certificate_details(i):
+    return {
+        "organization_id": f"org-{i}",
+        "recipient_name": f"Benchmark Organization {i}",
+        "checklist": STANDARDS[i % len(STANDARDS)],
+        "issued_date": date(2025, 1, 1) + timedelta(days=i % 365),
+    }
+
+
+def run(count):
+    sizes = []
+    started = time.perf_counter()
+    for i in range(count):
+        sizes.append(len(render_certificate_pdf(certificate_details(i))))
+    return time.perf_counter() - started, sizes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=1000, help='Certificates to render.')
+    args = parser.parse_args()
+
+    render_certificate_pdf(certificate_details(0))  # Warm-up: font metrics load on first use
+    elapsed, sizes = run(args.count)
+    print(f"count={args.count}")
+    print(f"{'seconds':>10}{'certs/s':>10}{'avg bytes':>11}")
+    print(f"{elapsed:>10.2f}{args.count / elapsed:>10.1f}{statistics.mean(sizes):>11.0f}")
+
+
+if __name__ == '__main__':
+    main()
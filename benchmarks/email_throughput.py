@@ -0,0 +1,138 @@
+"""
+Email throughput benchmark against the local SMTP sink (no network needed).
+
+Drives the invitation, audit-request and audit-created flows at ``--scale``
+recipients, reports the latency the HTTP request pays to queue them, then drains
+the outbox once with a connection per message and once over pooled connections.
+
+    python benchmarks/email_throughput.py --scale 500 --connect-delay 0.02
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DATABASE_URL', 'sqlite:///:memory:')
+os.environ.setdefault('SECRET_KEY', 'benchmark')
+
+from api import create_app  # noqa: E402
+from api.extensions import db, mail  # noqa: E402
+from api.models.models import (  # noqa: E402
+    User, Organization, CertificationBody, Audit, AuditRequest, Invitation, RoleEnum, EmailOutbox, OutboxStatusEnum
+)
+from api.utils.email_utils import (  # noqa: E402
+    send_invitation_email, send_audit_request_notification_to_cb_managers, send_audit_created_notification
+)
+from api.utils.outbox_utils import deliver_pending_emails  # noqa: E402
+from api.utils.smtp_sink import SMTPSink  # noqa: E402
+
+FLOWS = ('invitation', 'audit-request', 'audit-created')
+
+
+def seed(scale):
+    organization = Organization(name='Benchmark Org', address='1 Bench St', contact_email='org@bench.test',
+                                contact_phone='000')
+    certification_body = CertificationBody(name='Benchmark CB', address='2 Bench St', contact_email='cb@bench.test')
+    db.session.add_all([organization, certification_body])
+    db.session.flush()
+    org_users = [User(email=f'member{i}@bench.test', full_name=f'Member {i}', password_hash='-',
+                      organization_id=organization.id) for i in range(scale)]
+    cb_managers = [User(email=f'manager{i}@bench.test', full_name=f'Manager {i}', password_hash='-',
+                        certification_body_id=certification_body.id, role=RoleEnum.MANAGER) for i in range(scale)]
+    db.session.add_all(org_users + cb_managers)
+    db.session.commit()
+    return organization, certification_body, org_users, cb_managers
+
+
+def run_flow(flow, scale, organization, certification_body, org_users, cb_managers):
+    """Return per-request latencies (seconds) for queuing ``flow``'s emails and committing."""
+    latencies = []
+    if flow == 'invitation':
+        for i in range(scale):
+            invitation = Invitation(email=f'invitee{i}@bench.test', role=RoleEnum.EMPLOYEE,
+                                    organization_id=organization.id, token=f'token-{i}',
+                                    expires_at=datetime.utcnow() + timedelta(days=7))
+            started = time.perf_counter()
+            send_invitation_email(invitation, organization.name, 'Organization')
+            db.session.commit()
+            latencies.append(time.perf_counter() - started)
+    elif flow == 'audit-request':
+        audit_request = AuditRequest(organization_id=organization.id, certification_body_id=certification_body.id,
+                                     requested_by_id=org_users[0].id, name='Benchmark audit request',
+                                     standard_ids='ISO 9001, ISO 27001', scheduled_date=str(date.today()))
+        db.session.add(audit_request)
+        db.session.flush()
+        started = time.perf_counter()
+        send_audit_request_notification_to_cb_managers(audit_request, cb_managers)
+        db.session.commit()
+        latencies.append(time.perf_counter() - started)
+    elif flow == 'audit-created':
+        audit = Audit(name='Benchmark audit', organization_id=organization.id,
+                      certification_body_id=certification_body.id, scheduled_date=date.today(),
+                      checklist='ISO 9001, ISO 27001', manager_id=cb_managers[0].id)
+        db.session.add(audit)
+        db.session.flush()
+        started = time.perf_counter()
+        send_audit_created_notification(audit, org_users)
+        db.session.commit()
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def drain(sink, pooled):
+    """Deliver every pending outbox row and return (messages, seconds, smtp sessions)."""
+    sink.reset()
+    started = time.perf_counter()
+    while deliver_pending_emails(pooled=pooled):
+        pass
+    elapsed = time.perf_counter() - started
+    return len(sink.messages), elapsed, sink.connections
+
+
+def reset_outbox():
+    EmailOutbox.query.update({EmailOutbox.status: OutboxStatusEnum.PENDING, EmailOutbox.attempts: 0,
+                              EmailOutbox.next_attempt_at: datetime.utcnow() - timedelta(seconds=1)})
+    db.session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scale', type=int, default=200, help='Recipients per flow.')
+    parser.add_argument('--flows', default=','.join(FLOWS), help=f'Comma-separated subset of {", ".join(FLOWS)}.')
+    parser.add_argument('--connect-delay', type=float, default=0.0,
+                        help='Seconds the sink stalls each new SMTP session (models TLS + AUTH).')
+    parser.add_argument('--batch-size', type=int, default=100, help='Outbox rows claimed per delivery round.')
+    args = parser.parse_args()
+
+    with SMTPSink(connect_delay=args.connect_delay) as sink:
+        app = create_app()
+        app.config.update(MAIL_SERVER=sink.host, MAIL_PORT=sink.port, MAIL_USE_TLS=False, MAIL_USE_SSL=False,
+                          MAIL_USERNAME=None, MAIL_PASSWORD=None,
+                          OUTBOX_BATCH_SIZE=args.batch_size, SERVER_NAME='localhost')
+        mail.init_app(app)
+
+        with app.app_context(), app.test_request_context():
+            fixtures = seed(args.scale)
+            print(f"scale={args.scale} batch={args.batch_size} connect_delay={args.connect_delay}s")
+            print(f"{'flow':<15}{'requests':>9}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}")
+            for flow in [name.strip() for name in args.flows.split(',') if name.strip()]:
+                if flow not in FLOWS:
+                    parser.error(f"unknown flow {flow!r}")
+                latencies = sorted(run_flow(flow, args.scale, *fixtures))
+                p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+                print(f"{flow:<15}{len(latencies):>9}{statistics.median(latencies) * 1000:>10.2f}"
+                      f"{p95 * 1000:>10.2f}{latencies[-1] * 1000:>10.2f}")
+
+            print(f"\n{'delivery':<15}{'messages':>9}{'seconds':>10}{'msg/s':>10}{'sessions':>10}")
+            for label, pooled in (('per-message', False), ('pooled', True)):
+                reset_outbox()
+                sent, elapsed, sessions = drain(sink, pooled)
+                print(f"{label:<15}{sent:>9}{elapsed:>10.2f}{sent / elapsed if elapsed else 0:>10.1f}{sessions:>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""
+Standards keyword search benchmark: in-process BM25 index against Mongo $text.
+
+Builds the BM25 index from a snapshot of the catalogue, then times each query
+the way /standards/ serves it: $text with the page sort plus a count, or a
+BM25 lookup plus one ``_id`` fetch for the page. Reports build time, index
+size and per-query latency.
+
+    MONGODB_URI=mongodb://localhost:27017 python benchmarks/standards_search.py --repeat 20
+    python benchmarks/standards_search.py --synthetic 25000  # BM25 only, generated catalogue
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from api.models.mongodb_model import STANDARDS_SORT  # noqa: E402
+from api.utils.search_index import BM25Index, INDEXED_FIELDS  # noqa: E402
+from api.utils.standards_utils import ACTIVE_STANDARDS  # noqa: E402
+
+QUERIES = ('quality management', 'information security', '9001', '27001 requirements', 'medical devices',
+           'environmental management systems', 'road vehicles safety', 'food safety', 'energy', 'risk guidelines')
+WORDS = ('quality', 'management', 'systems', 'requirements', 'information', 'security', 'environmental', 'guidance',
+         'vocabulary', 'medical', 'devices', 'road', 'vehicles', 'safety', 'testing', 'methods', 'general', 'energy',
+         'food', 'risk', 'guidelines', 'principles', 'specification', 'measurement', 'water', 'plastics', 'steel')
+PAGE = 50
+
+
+def synthetic_catalogue(count, vocabulary=20000):
+    """Generated standards whose words follow a Zipf-like distribution, as real titles do."""
+    rng = random.Random(0)
+    words = list(WORDS) + [f"term{i}" for i in range(vocabulary)]
+    weights = [1 / rank for rank in range(1, len(words) + 1)]
+
+    def text(length):
+        return ' '.join(rng.choices(words, weights, k=length))
+
+    for i in range(count):
+        yield {
+            '_id': i,
+            'Iso': f"ISO{rng.choice(('', '/IEC'))} {rng.randint(1, 80000)}:{rng.randint(1990, 2024)}",
+            'Category': rng.choice(WORDS).title(),
+            'SubCategory': rng.choice(WORDS).title(),
+            'description': text(rng.randint(4, 14)).capitalize(),
+            'abstract': text(rng.randint(40, 120)),
+        }
+
+
+def index_bytes(index):
+    return sum(ordinals.itemsize * len(ordinals) + tfs.itemsize * len(tfs) for ordinals, tfs in index.postings.values())
+
+
+def time_queries(search, repeat):
+    samples = []
+    for _ in range(repeat):
+        for query in QUERIES:
+            started = time.perf_counter()
+            search(query)
+            samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return statistics.mean(samples), samples[len(samples) // 2], samples[int(len(samples) * 0.95)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=10, help='Times each query is run per engine.')
+    parser.add_argument('--synthetic', type=int, default=0, help='Benchmark BM25 alone on this many generated standards.')
+    parser.add_argument('--mongo-uri', default=os.getenv('MONGODB_URI'), help='Catalogue to benchmark (default: $MONGODB_URI).')
+    args = parser.parse_args()
+
+    collection = None
+    if args.synthetic:
+        standards = list(synthetic_catalogue(args.synthetic))
+    elif args.mongo_uri:
+        from pymongo import MongoClient
+        collection = MongoClient(args.mongo_uri)['iso']['ISO']
+        standards = list(collection.find(ACTIVE_STANDARDS, INDEXED_FIELDS))
+    else:
+        parser.error('set --mongo-uri / MONGODB_URI, or use --synthetic')
+
+    started = time.perf_counter()
+    index = BM25Index.from_documents(standards)
+    build = time.perf_counter() - started
+    print(f"standards={len(index)} terms={len(index.postings)} postings={index_bytes(index) / 1e6:.1f} MB "
+          f"build={build:.2f}s")
+
+    def bm25(query):
+        ranked, _ = index.search(query, limit=PAGE + 1)
+        if collection is not None:
+            list(collection.find({'_id': {'$in': [standard_id for standard_id, _ in ranked]}}))
+
+    def text(query):
+        query = dict(ACTIVE_STANDARDS, **{'$text': {'$search': query}})
+        list(collection.find(query, sort=STANDARDS_SORT, limit=PAGE + 1))
+        collection.count_documents(query)
+
+    print(f"{'engine':<8}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}")
+    for label, search in (('bm25', bm25), ('$text', text)):
+        if label == '$text' and collection is None:
+            continue
+        mean, p50, p95 = time_queries(search, args.repeat)
+        print(f"{label:<8}{mean:>10.2f}{p50:>10.2f}{p95:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -24,7 +24,14 @@ interface Standard {
   publication_date: string;
 }
 
+// List results carry only what the cards show; the dialog loads the full standard
+type StandardSummary = Pick<Standard, 'Iso' | 'Category' | 'SubCategory'>;
+
 const ITEMS_PER_PAGE = 10;
+const LIST_FIELDS = 'Iso,Category,SubCategory';
+
+// Iso numbers such as "ISO/IEC 27001:2022" contain slashes; the detail route takes them as path segments
+const standardPath = (iso: string) => `/standards/${iso.split('/').map(encodeURIComponent).join('/')}`;
 
 const Standards: React.FC = () => {
   const { toast } = useToast();
@@ -32,7 +39,7 @@ const Standards: React.FC = () => {
   const { userProfile } = useUserProfileContext();
 
   const [searchQuery, setSearchQuery] = useState('');
-  const [standards, setStandards] = useState<Standard[]>([]);
+  const [standards, setStandards] = useState<StandardSummary[]>([]);
   const [selectedStandard, setSelectedStandard] = useState<Standard | null>(null);
   const [isLoading, setIsLoading] = useState(false);
   const [categories, setCategories] = useState<string[]>([]);
@@ -70,6 +77,7 @@ const Standards: React.FC = () => {
         offset: String((currentPage - 1) * ITEMS_PER_PAGE),
         limit: String(ITEMS_PER_PAGE),
         category: categoryFilter,
+        fields: LIST_FIELDS,
       });
 
       const response = await fetchWithAuth(`/standards/?${params.toString()}`, {
@@ -101,6 +109,21 @@ const Standards: React.FC = () => {
     }
   };
 
+  const openStandard = async (iso: string) => {
+    try {
+      const response = await fetchWithAuth(standardPath(iso), { method: 'GET' });
+      if (!response.ok) throw new Error('Failed to fetch standard');
+      setSelectedStandard(await response.json());
+    } catch (error) {
+      console.error('Fetch error:', error);
+      toast({
+        title: 'Error',
+        description: 'Failed to load standard details',
+        variant: 'destructive',
+      });
+    }
+  };
+
   const handlePageChange = (newPage: number) => {
     if (newPage >= 1 && newPage <= totalPages) {
       setCurrentPage(newPage);
@@ -164,7 +187,7 @@ const Standards: React.FC = () => {
                 <div
                   key={standard.Iso}
                   className="w-full p-4 bg-card rounded-lg shadow-sm border hover:bg-muted/50 transition-colors cursor-pointer"
-                  onClick={() => setSelectedStandard(standard)}
+                  onClick={() => openStandard(standard.Iso)}
                 >
                   <div className="flex justify-between items-start">
                     <div className="space-y-2">
@@ -262,6 +285,7 @@ const Standards: React.FC = () => {
                 <div className="col-span-2">
                   <Button
                     className="w-full"
+                    disabled={!selectedStandard.url}
                     onClick={() => window.open(selectedStandard.url, '_blank')}
                   >
                     <ExternalLink className="w-4 h-4 mr-2" />
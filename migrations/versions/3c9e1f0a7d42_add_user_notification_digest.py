@@ -0,0 +1,35 @@
+"""Add users.notification_digest
+
+Revision ID: 3c9e1f0a7d42
+Revises: 6b1860c772f3
+Create Date: 2026-10-19 09:12:31.402118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c9e1f0a7d42'
+down_revision = '6b1860c772f3'
+branch_labels = None
+depends_on = None
+
+digest_frequency = sa.Enum('IMMEDIATE', 'HOURLY', 'DAILY', name='digestfrequencyenum')
+
+
+def upgrade():
+    bind = op.get_bind()
+    # create_app() runs db.create_all(), so a database created since the model change already has the column
+    if 'notification_digest' in {column['name'] for column in sa.inspect(bind).get_columns('users')}:
+        return
+    digest_frequency.create(bind, checkfirst=True)
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('notification_digest', digest_frequency, nullable=False,
+                                      server_default='IMMEDIATE'))
+
+
+def downgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_column('notification_digest')
+    digest_frequency.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,79 @@
+"""Add certification PDF status and verification code columns
+
+Revision ID: 8f2d4b6a1e07
+Revises: 3c9e1f0a7d42
+Create Date: 2026-10-19 09:48:05.917352
+
+"""
+import secrets
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8f2d4b6a1e07'
+down_revision = '3c9e1f0a7d42'
+branch_labels = None
+depends_on = None
+
+pdf_status = sa.Enum('PENDING', 'READY', 'FAILED', 'ON_DEMAND', name='pdfstatusenum')
+# Same alphabet and format as models.generate_verification_code
+VERIFICATION_CODE_ALPHABET = '0123456789ABCDEFGHJKMNPQRSTVWXYZ'
+
+certifications = sa.table(
+    'certifications',
+    sa.column('id', sa.String),
+    sa.column('certificate_pdf', sa.String),
+    sa.column('pdf_status', pdf_status),
+    sa.column('pdf_rendered_at', sa.DateTime),
+    sa.column('verification_code', sa.String),
+    sa.column('created_at', sa.DateTime),
+)
+
+
+def generate_verification_code():
+    raw = ''.join(secrets.choice(VERIFICATION_CODE_ALPHABET) for _ in range(12))
+    return '-'.join(raw[i:i + 4] for i in range(0, 12, 4))
+
+
+def upgrade():
+    bind = op.get_bind()
+    # create_app() runs db.create_all(), so a database created since the model change already has the columns
+    if 'pdf_status' in {column['name'] for column in sa.inspect(bind).get_columns('certifications')}:
+        return
+    pdf_status.create(bind, checkfirst=True)
+    with op.batch_alter_table('certifications', schema=None) as batch_op:
+        batch_op.alter_column('certificate_pdf', existing_type=sa.String(), nullable=True)
+        batch_op.add_column(sa.Column('pdf_status', pdf_status, nullable=False, server_default='PENDING'))
+        batch_op.add_column(sa.Column('pdf_sha256', sa.String(length=64), nullable=True))
+        batch_op.add_column(sa.Column('pdf_error', sa.Text(), nullable=True))
+        batch_op.add_column(sa.Column('pdf_rendered_at', sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column('verification_code', sa.String(length=14), nullable=True))
+
+    # Existing certificates were rendered when issued; their certificate_pdf is a legacy absolute path
+    op.execute(certifications.update()
+               .where(certifications.c.certificate_pdf.isnot(None))
+               .values(pdf_status='READY', pdf_rendered_at=certifications.c.created_at))
+    ids = [row.id for row in bind.execute(sa.select(certifications.c.id))]
+    for certification_id in ids:
+        bind.execute(certifications.update()
+                     .where(certifications.c.id == certification_id)
+                     .values(verification_code=generate_verification_code()))
+
+    with op.batch_alter_table('certifications', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_certifications_pdf_status'), ['pdf_status'], unique=False)
+        batch_op.create_index(batch_op.f('ix_certifications_verification_code'), ['verification_code'], unique=True)
+
+
+def downgrade():
+    with op.batch_alter_table('certifications', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_certifications_verification_code'))
+        batch_op.drop_index(batch_op.f('ix_certifications_pdf_status'))
+        batch_op.drop_column('verification_code')
+        batch_op.drop_column('pdf_rendered_at')
+        batch_op.drop_column('pdf_error')
+        batch_op.drop_column('pdf_sha256')
+        batch_op.drop_column('pdf_status')
+    pdf_status.drop(op.get_bind(), checkfirst=True)
+    # certificate_pdf stays nullable: rows issued since the upgrade may have no stored PDF
@@ -1,11 +1,15 @@
+import multiprocessing
+
 from flask_cors import CORS
 from flask_smorest import Api
 
 from api import create_app
 
-app = create_app()
+# The bulk render pool spawns its workers, which re-import this module; they only render PDFs and need no app
+if multiprocessing.parent_process() is None:
+    app = create_app()
+    CORS(app, resources={r"/*": {"origins": "*"}}, expose_headers=["X-Total-Count", "X-Total-Count-Exact", "X-Has-More", "X-Next-Cursor"],
+         supports_credentials=True)
 
 if __name__ == "__main__":
-    CORS(app, resources={r"/*": {"origins": "*"}}, expose_headers=["X-Total-Count"],
-         supports_credentials=True)
     app.run(host="0.0.0.0", port=5000, debug=True, ssl_context=('cert.pem', 'key.pem'))